@@ -27,9 +27,13 @@ class HTMLReportGenerator:
 
     def generate(self, report_data: dict[str, Any], output_dir: Path) -> Path:
         """Generate HTML report file."""
+        return self.write(self.render(report_data), output_dir)
+
+    def render(self, report_data: dict[str, Any]) -> str:
+        """Render the HTML report to a string."""
         template = self.env.get_template("report.html")
 
-        html_content = template.render(
+        return template.render(
             metadata=report_data["metadata"],
             config=report_data["config"],
             findings=report_data["findings"],
@@ -39,6 +43,8 @@ class HTMLReportGenerator:
             remediation_timeline=report_data["remediation_timeline"],
         )
 
+    def write(self, html_content: str, output_dir: Path) -> Path:
+        """Write rendered HTML to the report file in output_dir."""
         output_path = output_dir / "report.html"
         output_path.write_text(html_content, encoding="utf-8")
         return output_path
@@ -41,8 +41,9 @@ class PDFReportGenerator:
 
         If weasyprint is not available, generates HTML instead.
         """
-        # First generate HTML
-        html_path = self.html_generator.generate(report_data, output_dir)
+        # First generate HTML, keeping the rendered text for the PDF pass
+        html_content = self.html_generator.render(report_data)
+        html_path = self.html_generator.write(html_content, output_dir)
 
         if not _WEASYPRINT_AVAILABLE:
             # Return HTML path with warning - caller should handle
@@ -51,7 +52,6 @@ class PDFReportGenerator:
         # Convert HTML to PDF
         pdf_path = output_dir / "report.pdf"
 
-        html_content = html_path.read_text(encoding="utf-8")
         html_doc = WeasyprintHTML(string=html_content, base_url=str(output_dir))
         html_doc.write_pdf(pdf_path)
 
@@ -1,10 +1,81 @@
 from __future__ import annotations
 
+import bisect
 import ipaddress
 import socket
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
+# Successful lookups are reused briefly so repeated checks of the same
+# host skip the blocking getaddrinfo call. Failures are never cached.
+RESOLVE_CACHE_SIZE = 1024
+RESOLVE_CACHE_TTL = 60.0
+
+_resolve_cache: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+# Guards _resolve_cache; getaddrinfo itself runs outside the lock
+_resolve_lock = threading.Lock()
+
+_DEFAULT_SCHEMES: frozenset[str] = frozenset({"http", "https"})
+
+# IANA special-purpose ranges that are never valid scan targets. The table is
+# fixed rather than derived from ipaddress.is_global, so the policy is the same
+# on every Python version. It blocks everything the stdlib treats as
+# non-global and is stricter in two ranges: all of 192.0.0.0/24 is blocked,
+# including 192.0.0.9 and 192.0.0.10 which is_global accepts, and all of
+# 2001::/23, although Python 3.13 treats parts of it (e.g. 2001:1::1 and
+# 2001:20::/28) as global. IPv4-mapped IPv6 addresses use the IPv4 table.
+_BLOCKED_V4_CIDRS = (
+    "0.0.0.0/8",
+    "10.0.0.0/8",
+    "100.64.0.0/10",
+    "127.0.0.0/8",
+    "169.254.0.0/16",
+    "172.16.0.0/12",
+    "192.0.0.0/24",
+    "192.0.2.0/24",
+    "192.168.0.0/16",
+    "198.18.0.0/15",
+    "198.51.100.0/24",
+    "203.0.113.0/24",
+    "240.0.0.0/4",
+    "255.255.255.255/32",
+)
+_BLOCKED_V6_CIDRS = (
+    "::/128",
+    "::1/128",
+    "64:ff9b:1::/48",
+    "100::/64",
+    "2001::/23",
+    "2001:db8::/32",
+    "2002::/16",
+    "3fff::/20",
+    "fc00::/7",
+    "fe80::/10",
+)
+
+
+def _interval_table(cidrs: tuple[str, ...]) -> tuple[list[int], list[int]]:
+    """Merge CIDRs into sorted, disjoint (starts, ends) integer intervals."""
+    starts: list[int] = []
+    ends: list[int] = []
+    networks = sorted(ipaddress.ip_network(cidr) for cidr in cidrs)
+    for network in networks:
+        first = int(network.network_address)
+        last = int(network.broadcast_address)
+        if ends and first <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], last)
+        else:
+            starts.append(first)
+            ends.append(last)
+    return starts, ends
+
+
+_BLOCKED_V4 = _interval_table(_BLOCKED_V4_CIDRS)
+_BLOCKED_V6 = _interval_table(_BLOCKED_V6_CIDRS)
+
 
 class UrlPolicyError(ValueError):
     """Raised when a URL fails policy validation."""
@@ -22,7 +93,7 @@ class UrlPolicy:
     allowed_domains: frozenset[str] = field(default_factory=frozenset)
     blocked_domains: frozenset[str] = field(default_factory=frozenset)
     max_redirects: int = 2
-    allowed_schemes: frozenset[str] = field(default_factory=lambda: frozenset({"http", "https"}))
+    allowed_schemes: frozenset[str] = _DEFAULT_SCHEMES
 
 
 def validate_target_url(url: str, policy: UrlPolicy | None = None) -> str:
@@ -65,7 +136,7 @@ def validate_target_url(url: str, policy: UrlPolicy | None = None) -> str:
                 raise UrlPolicyError(f"blocked domain: {hostname}")
 
     # Check localhost variants
-    if hostname_lower in {"localhost"} or hostname_lower.endswith(".local"):
+    if hostname_lower == "localhost" or hostname_lower.endswith(".local"):
         raise UrlPolicyError("local hostnames are blocked")
 
     # Check allowed domains (if specified, acts as allowlist)
@@ -111,17 +182,8 @@ def _is_ip_literal(hostname: str) -> bool:
 
 def _resolve_host(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
     """Resolve hostname to IP addresses."""
-    try:
-        infos = socket.getaddrinfo(hostname, None)
-    except socket.gaierror:
-        return []
-
     resolved: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
-    for info in infos:
-        sockaddr = info[4]
-        if not sockaddr:
-            continue
-        address = sockaddr[0]
+    for address in _lookup_addresses(hostname):
         try:
             resolved.append(ipaddress.ip_address(address))
         except ValueError:
@@ -129,10 +191,39 @@ def _resolve_host(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6A
     return resolved
 
 
+def _lookup_addresses(hostname: str) -> tuple[str, ...]:
+    """Return the raw addresses for hostname, reusing recent lookups."""
+    now = time.monotonic()
+    with _resolve_lock:
+        cached = _resolve_cache.get(hostname)
+        if cached is not None and cached[0] > now:
+            _resolve_cache.move_to_end(hostname)
+            return cached[1]
+
+    try:
+        infos = socket.getaddrinfo(hostname, None)
+    except socket.gaierror:
+        with _resolve_lock:
+            _resolve_cache.pop(hostname, None)
+        return ()
+
+    addresses = tuple(str(info[4][0]) for info in infos if info[4])
+    with _resolve_lock:
+        _resolve_cache[hostname] = (now + RESOLVE_CACHE_TTL, addresses)
+        _resolve_cache.move_to_end(hostname)
+        while len(_resolve_cache) > RESOLVE_CACHE_SIZE:
+            _resolve_cache.popitem(last=False)
+    return addresses
+
+
 def _is_blocked_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
     """Check if IP is in a blocked range (non-global/public)."""
-    # Block all non-global IPs by default (private, loopback, link-local, etc.)
-    return not ip.is_global
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    starts, ends = _BLOCKED_V4 if ip.version == 4 else _BLOCKED_V6
+    value = int(ip)
+    pos = bisect.bisect_right(starts, value) - 1
+    return pos >= 0 and value <= ends[pos]
 
 
 def is_private_ip_range(cidr: str) -> bool:
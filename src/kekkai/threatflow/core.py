@@ -136,7 +136,7 @@ class ThreatFlow:
 
         # Initialize security components
         self._redactor = ThreatFlowRedactor()
-        self._sanitizer = Sanitizer()
+        self._sanitizer = Sanitizer.default()
         self._prompt_builder = PromptBuilder()
 
     @property
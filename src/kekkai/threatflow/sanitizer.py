@@ -18,9 +18,11 @@ ASVS 5.0 Requirements:
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, ClassVar
@@ -63,7 +65,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="ignore_instructions",
         pattern=re.compile(
-            r"(?i)\b(ignore|disregard|forget)\s+(all\s+)?(previous|prior|above|earlier)\s+"
+            r"\b(ignore|disregard|forget)\s+(all\s+)?(previous|prior|above|earlier)\s+"
             r"(instructions?|prompts?|rules?|context)",
             re.IGNORECASE,
         ),
@@ -73,7 +75,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="new_instructions",
         pattern=re.compile(
-            r"(?i)\b(new|actual|real)\s+(instructions?|task|objective|goal)\s*:",
+            r"\b(new|actual|real)\s+(instructions?|task|objective|goal)\s*:",
             re.IGNORECASE,
         ),
         risk=InjectionRisk.HIGH,
@@ -83,7 +85,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="role_play",
         pattern=re.compile(
-            r"(?i)\b(you\s+are\s+now|pretend\s+(to\s+be|you\s+are)|act\s+as\s+(if|a))",
+            r"\b(you\s+are\s+now|pretend\s+(to\s+be|you\s+are)|act\s+as\s+(if|a))",
             re.IGNORECASE,
         ),
         risk=InjectionRisk.HIGH,
@@ -92,7 +94,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="system_prompt_ref",
         pattern=re.compile(
-            r"(?i)(system\s*prompt|initial\s*prompt|original\s*instructions?)",
+            r"(system\s*prompt|initial\s*prompt|original\s*instructions?)",
             re.IGNORECASE,
         ),
         risk=InjectionRisk.MEDIUM,
@@ -121,7 +123,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="print_env",
         pattern=re.compile(
-            r"(?i)(print|show|display|output|reveal|dump)\s+"
+            r"(print|show|display|output|reveal|dump)\s+"
             r"(all\s+)?(env|environment|secrets?|api[_\s]?keys?|tokens?|credentials?)",
             re.IGNORECASE,
         ),
@@ -131,7 +133,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="curl_wget",
         pattern=re.compile(
-            r"(?i)(curl|wget|fetch|http\s*request)\s+(https?://|[\"']https?://)",
+            r"(curl|wget|fetch|http\s*request)\s+(https?://|[\"']https?://)",
             re.IGNORECASE,
         ),
         risk=InjectionRisk.MEDIUM,
@@ -140,13 +142,15 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     # Jailbreak patterns
     InjectionPattern(
         name="dan_jailbreak",
-        pattern=re.compile(r"(?i)\bDAN\b.{0,50}(mode|persona|jailbreak)", re.IGNORECASE),
+        pattern=re.compile(r"\bDAN\b.{0,50}(mode|persona|jailbreak)", re.IGNORECASE),
         risk=InjectionRisk.CRITICAL,
         description="DAN-style jailbreak attempt",
     ),
     InjectionPattern(
         name="developer_mode",
-        pattern=re.compile(r"(?i)(developer|debug|admin)\s*mode\s*(enabled?|on|activated?)"),
+        pattern=re.compile(
+            r"(developer|debug|admin)\s*mode\s*(enabled?|on|activated?)", re.IGNORECASE
+        ),
         risk=InjectionRisk.HIGH,
         description="Developer mode jailbreak",
     ),
@@ -154,7 +158,7 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     InjectionPattern(
         name="exec_command",
         pattern=re.compile(
-            r"(?i)(execute|run|eval)\s+(this\s+)?(code|command|script|shell)",
+            r"(execute|run|eval)\s+(this\s+)?(code|command|script|shell)",
             re.IGNORECASE,
         ),
         risk=InjectionRisk.HIGH,
@@ -169,6 +173,56 @@ _INJECTION_PATTERNS: list[InjectionPattern] = [
     ),
 ]
 
+_SearchFn = Callable[[str], re.Match[str] | None]
+_SubFn = Callable[[Callable[[re.Match[str]], str], str], str]
+
+
+# Injection payloads tend to repeat the same tokens (e.g. many <|im_start|>),
+# so escaped forms are memoized by matched text.
+_ESCAPE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_ESCAPE_CACHE_SIZE)
+def _bracket(text: str) -> str:
+    return f"\u2039{text}\u203a"
+
+
+def _escape_bracket(match: re.Match[str]) -> str:
+    """Wrap a matched injection pattern in unicode brackets to neutralize it."""
+    return _bracket(match.group(0))
+
+
+# Similar-looking unicode replacements for delimiter characters
+_UNICODE_ESCAPES = str.maketrans(
+    {
+        "<": "\uff1c",  # Fullwidth less-than
+        ">": "\uff1e",  # Fullwidth greater-than
+        "|": "\u2502",  # Box drawing vertical
+    }
+)
+
+
+@functools.lru_cache(maxsize=_ESCAPE_CACHE_SIZE)
+def _unicode(text: str) -> str:
+    return text.translate(_UNICODE_ESCAPES)
+
+
+def _escape_unicode(match: re.Match[str]) -> str:
+    """Replace delimiter characters in a match with similar-looking unicode."""
+    return _unicode(match.group(0))
+
+
+def _escape_remove(match: re.Match[str]) -> str:
+    """Replace a matched injection pattern with a placeholder."""
+    return "[SANITIZED]"
+
+
+_ESCAPE_FUNCS: dict[str, Callable[[re.Match[str]], str]] = {
+    "bracket": _escape_bracket,
+    "unicode": _escape_unicode,
+    "remove": _escape_remove,
+}
+
 
 @dataclass
 class SanitizeResult:
@@ -178,19 +232,14 @@ class SanitizeResult:
     sanitized: str
     injections_found: list[tuple[str, InjectionRisk, str]] = field(default_factory=list)
     was_modified: bool = False
+    # Derived once from injections_found at construction
+    has_critical_injection: bool = field(init=False)
+    has_high_injection: bool = field(init=False)
 
-    @property
-    def has_critical_injection(self) -> bool:
-        """Check if any critical injection patterns were found."""
-        return any(risk == InjectionRisk.CRITICAL for _, risk, _ in self.injections_found)
-
-    @property
-    def has_high_injection(self) -> bool:
-        """Check if any high-risk injection patterns were found."""
-        return any(
-            risk in (InjectionRisk.CRITICAL, InjectionRisk.HIGH)
-            for _, risk, _ in self.injections_found
-        )
+    def __post_init__(self) -> None:
+        risks = {risk for _, risk, _ in self.injections_found}
+        self.has_critical_injection = InjectionRisk.CRITICAL in risks
+        self.has_high_injection = self.has_critical_injection or InjectionRisk.HIGH in risks
 
     def to_dict(self) -> dict[str, object]:
         """Convert to dictionary for logging."""
@@ -216,41 +265,56 @@ class Sanitizer:
     custom_patterns: list[InjectionPattern] = field(default_factory=list)
     escape_mode: str = "bracket"  # "bracket", "unicode", or "remove"
     _patterns: list[InjectionPattern] = field(init=False)
+    # Bound regex methods hoisted out of the detect/sanitize hot loops
+    _search_fns: list[tuple[_SearchFn, str, InjectionRisk, str]] = field(
+        init=False, repr=False, compare=False
+    )
+    _sub_fns: list[_SubFn] = field(init=False, repr=False, compare=False)
+    _escape: Callable[[re.Match[str]], str] = field(init=False, repr=False, compare=False)
+    _read_only: bool = field(default=False, init=False, repr=False, compare=False)
 
     PATTERNS: ClassVar[list[InjectionPattern]] = _INJECTION_PATTERNS
 
     def __post_init__(self) -> None:
         self._patterns = list(self.PATTERNS) + self.custom_patterns
+        # Resolve escape_mode once; unknown modes fall back to "remove"
+        self._escape = _ESCAPE_FUNCS.get(self.escape_mode, _escape_remove)
+        self._search_fns = []
+        self._sub_fns = []
+        for pattern in self._patterns:
+            self._index_pattern(pattern)
+
+    @classmethod
+    @functools.cache
+    def default(cls) -> Sanitizer:
+        """Return a shared, read-only instance with the built-in patterns.
+
+        The instance is built once per class and reused, so callers that
+        only need the default patterns skip per-construction setup.
+        Use ``Sanitizer()`` directly when custom patterns are required.
+        """
+        instance = cls()
+        instance._read_only = True
+        return instance
+
+    def _index_pattern(self, pattern: InjectionPattern) -> None:
+        """Precompute the bound search/sub methods for a pattern."""
+        self._search_fns.append(
+            (pattern.pattern.search, pattern.name, pattern.risk, pattern.description)
+        )
+        if pattern.risk in (InjectionRisk.CRITICAL, InjectionRisk.HIGH):
+            self._sub_fns.append(pattern.pattern.sub)
 
     def detect(self, text: str) -> list[tuple[str, InjectionRisk, str]]:
         """Detect potential injection patterns without modifying.
 
         Returns list of (pattern_name, risk_level, description).
         """
-        found: list[tuple[str, InjectionRisk, str]] = []
-        for pattern in self._patterns:
-            if pattern.pattern.search(text):
-                found.append((pattern.name, pattern.risk, pattern.description))
-        return found
-
-    def _escape_pattern(self, match: re.Match[str]) -> str:
-        """Escape a matched injection pattern."""
-        text = match.group(0)
-        if self.escape_mode == "bracket":
-            # Wrap in unicode brackets to neutralize
-            return f"\u2039{text}\u203a"
-        elif self.escape_mode == "unicode":
-            # Replace with similar-looking unicode chars
-            replacements = {
-                "<": "\uff1c",  # Fullwidth less-than
-                ">": "\uff1e",  # Fullwidth greater-than
-                "|": "\u2502",  # Box drawing vertical
-            }
-            for old, new in replacements.items():
-                text = text.replace(old, new)
-            return text
-        else:  # remove
-            return "[SANITIZED]"
+        return [
+            (name, risk, description)
+            for search, name, risk, description in self._search_fns
+            if search(text)
+        ]
 
     def sanitize(self, text: str) -> SanitizeResult:
         """Sanitize text by detecting and neutralizing injection patterns.
@@ -262,9 +326,9 @@ class Sanitizer:
             return SanitizeResult(original=text, sanitized=text, was_modified=False)
 
         sanitized = text
-        for pattern in self._patterns:
-            if pattern.risk in (InjectionRisk.CRITICAL, InjectionRisk.HIGH):
-                sanitized = pattern.pattern.sub(self._escape_pattern, sanitized)
+        escape = self._escape
+        for sub in self._sub_fns:
+            sanitized = sub(escape, sanitized)
 
         return SanitizeResult(
             original=text,
@@ -298,15 +362,24 @@ class Sanitizer:
         risk: InjectionRisk,
         description: str = "",
     ) -> None:
-        """Add a custom injection detection pattern."""
-        self._patterns.append(
-            InjectionPattern(
-                name=name,
-                pattern=re.compile(regex),
-                risk=risk,
-                description=description or f"Custom pattern: {name}",
+        """Add a custom injection detection pattern.
+
+        Raises:
+            RuntimeError: If called on the shared ``Sanitizer.default()`` instance.
+        """
+        if self._read_only:
+            raise RuntimeError(
+                "Sanitizer.default() is shared and read-only; "
+                "create a Sanitizer() to add custom patterns"
             )
+        pattern = InjectionPattern(
+            name=name,
+            pattern=re.compile(regex),
+            risk=risk,
+            description=description or f"Custom pattern: {name}",
         )
+        self._patterns.append(pattern)
+        self._index_pattern(pattern)
 
 
 # JSON Schema for threat model output validation (Layer 3)
@@ -420,25 +493,25 @@ class InjectionClassifier:
     # Weighted patterns for classification
     _CLASSIFIER_PATTERNS: ClassVar[list[tuple[re.Pattern[str], float, str]]] = [
         # High confidence indicators
-        (re.compile(r"(?i)ignore\s+(all\s+)?previous", re.IGNORECASE), 0.9, "override_attempt"),
+        (re.compile(r"ignore\s+(all\s+)?previous", re.IGNORECASE), 0.9, "override_attempt"),
         (re.compile(r"<\|(?:im_start|im_end|system)\|>"), 0.95, "special_tokens"),
-        (re.compile(r"(?i)jailbreak|bypass\s+restrictions", re.IGNORECASE), 0.85, "jailbreak_term"),
-        (re.compile(r"(?i)you\s+are\s+now\s+(?:a|an)\s+", re.IGNORECASE), 0.8, "role_change"),
+        (re.compile(r"jailbreak|bypass\s+restrictions", re.IGNORECASE), 0.85, "jailbreak_term"),
+        (re.compile(r"you\s+are\s+now\s+(?:a|an)\s+", re.IGNORECASE), 0.8, "role_change"),
         # Medium confidence indicators
         (
-            re.compile(r"(?i)system\s*prompt|initial\s*instructions", re.IGNORECASE),
+            re.compile(r"system\s*prompt|initial\s*instructions", re.IGNORECASE),
             0.6,
             "prompt_reference",
         ),
-        (re.compile(r"(?i)respond\s+as\s+if", re.IGNORECASE), 0.65, "behavior_change"),
+        (re.compile(r"respond\s+as\s+if", re.IGNORECASE), 0.65, "behavior_change"),
         (
-            re.compile(r"(?i)output\s+your\s+(instructions|prompt)", re.IGNORECASE),
+            re.compile(r"output\s+your\s+(instructions|prompt)", re.IGNORECASE),
             0.7,
             "leak_attempt",
         ),
         # Lower confidence but cumulative
-        (re.compile(r"(?i)don'?t\s+follow\s+rules?", re.IGNORECASE), 0.5, "rule_violation"),
-        (re.compile(r"(?i)pretend\s+(to\s+be|you)", re.IGNORECASE), 0.55, "pretend"),
+        (re.compile(r"don'?t\s+follow\s+rules?", re.IGNORECASE), 0.5, "rule_violation"),
+        (re.compile(r"pretend\s+(to\s+be|you)", re.IGNORECASE), 0.55, "pretend"),
     ]
 
     def __init__(self, threshold: float = 0.7) -> None:
@@ -485,7 +558,7 @@ class TieredSanitizer:
 
     def __init__(self, config: SanitizeConfig | None = None) -> None:
         self.config = config or SanitizeConfig()
-        self._regex_sanitizer = Sanitizer()
+        self._regex_sanitizer = Sanitizer.default()
         self._injection_classifier = InjectionClassifier()
 
     def sanitize_input(self, content: str, source: str = "") -> TieredSanitizeResult:
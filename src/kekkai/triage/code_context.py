@@ -10,10 +10,13 @@ Provides secure code context extraction with security controls:
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..fix.prompts import FixPromptBuilder
+if TYPE_CHECKING:
+    from ..fix.prompts import FixPromptBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -26,51 +29,55 @@ __all__ = [
 MAX_FILE_SIZE_MB = 10
 
 # Sensitive file extensions to block (ASVS V8.3.4)
-SENSITIVE_EXTENSIONS = {
-    ".env",
-    ".pem",
-    ".key",
-    ".crt",
-    ".p12",
-    ".pfx",
-    ".jks",
-    ".keystore",
-    ".pub",
-    "id_rsa",
-    "id_dsa",
-    "id_ecdsa",
-    "id_ed25519",
-}
+SENSITIVE_EXTENSIONS = frozenset(
+    {
+        ".env",
+        ".pem",
+        ".key",
+        ".crt",
+        ".p12",
+        ".pfx",
+        ".jks",
+        ".keystore",
+        ".pub",
+        "id_rsa",
+        "id_dsa",
+        "id_ecdsa",
+        "id_ed25519",
+    }
+)
 
 # Binary file extensions to skip
-BINARY_EXTENSIONS = {
-    ".pyc",
-    ".pyo",
-    ".so",
-    ".dll",
-    ".dylib",
-    ".exe",
-    ".bin",
-    ".class",
-    ".jar",
-    ".war",
-    ".ear",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".bmp",
-    ".ico",
-    ".pdf",
-    ".zip",
-    ".tar",
-    ".gz",
-    ".bz2",
-    ".7z",
-    ".rar",
-    ".whl",
-    ".egg",
-}
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".pyc",
+        ".pyo",
+        ".so",
+        ".dll",
+        ".dylib",
+        ".exe",
+        ".bin",
+        ".class",
+        ".jar",
+        ".war",
+        ".ear",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".rar",
+        ".whl",
+        ".egg",
+    }
+)
 
 
 @dataclass
@@ -112,13 +119,26 @@ class CodeContextExtractor:
             max_file_size_mb: Maximum file size in MB (DoS protection).
         """
         self.repo_path = repo_path.resolve()
+        # Precomputed for _validate_path; join() adds a trailing separator only if missing
+        self._repo_str = str(self.repo_path)
+        self._repo_prefix = os.path.join(self._repo_str, "")
         self.max_file_size_mb = max_file_size_mb
-        self._prompt_builder = FixPromptBuilder(context_lines=10)
+        # Built on first use: importing the fix package pulls in the whole fix engine
+        self._prompt_builder_instance: FixPromptBuilder | None = None
         # Simple LRU cache: {file_path: file_content}
         # Limited to 20 files to prevent memory bloat
         self._file_cache: dict[str, str] = {}
         self._cache_max_size = 20
 
+    @property
+    def _prompt_builder(self) -> FixPromptBuilder:
+        """Prompt builder used for context extraction (lazy import)."""
+        if self._prompt_builder_instance is None:
+            from ..fix.prompts import FixPromptBuilder
+
+            self._prompt_builder_instance = FixPromptBuilder(context_lines=10)
+        return self._prompt_builder_instance
+
     def extract(self, file_path: str, line: int | None) -> CodeContext | None:
         """Extract code context from a file.
 
@@ -288,12 +308,9 @@ class CodeContextExtractor:
         Security:
             ASVS V5.3.3: Path validation to prevent directory traversal.
         """
-        try:
-            # Check if path is within repo_path
-            path.relative_to(self.repo_path)
-            return True
-        except ValueError:
-            return False
+        # String prefix check on resolved paths avoids exception-driven control flow
+        path_str = str(path)
+        return path_str == self._repo_str or path_str.startswith(self._repo_prefix)
 
     def _is_text_file(self, path: Path) -> bool:
         """Check if file is a text file (not binary).
@@ -304,18 +321,7 @@ class CodeContextExtractor:
         Returns:
             True if likely a text file, False if binary.
         """
-        suffix = path.suffix.lower()
-        name = path.name.lower()
-
-        # Check against binary extensions
-        if suffix in BINARY_EXTENSIONS:
-            return False
-
-        # Special cases without extensions
-        if name in ("dockerfile", "makefile", "vagrantfile", "jenkinsfile"):
-            return True
-
-        return True
+        return path.suffix.lower() not in BINARY_EXTENSIONS
 
     def _is_sensitive_file(self, path: Path) -> bool:
         """Check if file contains sensitive data (secrets, keys).
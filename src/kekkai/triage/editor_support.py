@@ -6,9 +6,12 @@ security validation per ASVS V5.1.3.
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 __all__ = [
     "EditorConfig",
@@ -17,8 +20,10 @@ __all__ = [
     "EDITOR_REGISTRY",
 ]
 
-# ASVS V5.1.3: Only allow safe characters in editor names
-EDITOR_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9/_.-]+$")
+# ASVS V5.1.3: Only allow safe characters in editor names.
+# Used with fullmatch: "$" would also accept a trailing newline.
+EDITOR_NAME_PATTERN = re.compile(r"[a-zA-Z0-9/_.-]+")
+_editor_name_ok = EDITOR_NAME_PATTERN.fullmatch
 
 
 @dataclass
@@ -34,39 +39,41 @@ class EditorConfig:
     syntax_type: str  # "vim", "vscode", "sublime", "notepadpp", "jetbrains"
 
 
-# Editor registry mapping base names to configurations
-EDITOR_REGISTRY: dict[str, EditorConfig] = {
-    # Vim family (syntax: editor +LINE file)
-    "vim": EditorConfig("vim", "vim"),
-    "nvim": EditorConfig("nvim", "vim"),
-    "neovim": EditorConfig("neovim", "vim"),
-    "vi": EditorConfig("vi", "vim"),
-    # Emacs family (syntax: editor +LINE file)
-    "emacs": EditorConfig("emacs", "vim"),
-    "nano": EditorConfig("nano", "vim"),
-    # VS Code (syntax: code -g file:line)
-    "code": EditorConfig("code", "vscode"),
-    "code-insiders": EditorConfig("code-insiders", "vscode"),
-    "codium": EditorConfig("codium", "vscode"),  # VSCodium (FOSS fork)
-    # Sublime Text (syntax: subl file:line)
-    "subl": EditorConfig("subl", "sublime"),
-    "sublime": EditorConfig("sublime", "sublime"),
-    "sublime_text": EditorConfig("sublime_text", "sublime"),
-    # Atom (syntax: atom file:line) - legacy but still used
-    "atom": EditorConfig("atom", "sublime"),
-    # Notepad++ (syntax: notepad++ -nLINE file)
-    "notepad++": EditorConfig("notepad++", "notepadpp"),
-    "notepad++.exe": EditorConfig("notepad++.exe", "notepadpp"),
-    # JetBrains IDEs (syntax: editor --line LINE file)
-    "idea": EditorConfig("idea", "jetbrains"),
-    "pycharm": EditorConfig("pycharm", "jetbrains"),
-    "webstorm": EditorConfig("webstorm", "jetbrains"),
-    "phpstorm": EditorConfig("phpstorm", "jetbrains"),
-    "goland": EditorConfig("goland", "jetbrains"),
-    "rider": EditorConfig("rider", "jetbrains"),
-    "clion": EditorConfig("clion", "jetbrains"),
-    "rubymine": EditorConfig("rubymine", "jetbrains"),
-}
+# Editor registry mapping base names to configurations (read-only)
+EDITOR_REGISTRY: Mapping[str, EditorConfig] = MappingProxyType(
+    {
+        # Vim family (syntax: editor +LINE file)
+        "vim": EditorConfig("vim", "vim"),
+        "nvim": EditorConfig("nvim", "vim"),
+        "neovim": EditorConfig("neovim", "vim"),
+        "vi": EditorConfig("vi", "vim"),
+        # Emacs family (syntax: editor +LINE file)
+        "emacs": EditorConfig("emacs", "vim"),
+        "nano": EditorConfig("nano", "vim"),
+        # VS Code (syntax: code -g file:line)
+        "code": EditorConfig("code", "vscode"),
+        "code-insiders": EditorConfig("code-insiders", "vscode"),
+        "codium": EditorConfig("codium", "vscode"),  # VSCodium (FOSS fork)
+        # Sublime Text (syntax: subl file:line)
+        "subl": EditorConfig("subl", "sublime"),
+        "sublime": EditorConfig("sublime", "sublime"),
+        "sublime_text": EditorConfig("sublime_text", "sublime"),
+        # Atom (syntax: atom file:line) - legacy but still used
+        "atom": EditorConfig("atom", "sublime"),
+        # Notepad++ (syntax: notepad++ -nLINE file)
+        "notepad++": EditorConfig("notepad++", "notepadpp"),
+        "notepad++.exe": EditorConfig("notepad++.exe", "notepadpp"),
+        # JetBrains IDEs (syntax: editor --line LINE file)
+        "idea": EditorConfig("idea", "jetbrains"),
+        "pycharm": EditorConfig("pycharm", "jetbrains"),
+        "webstorm": EditorConfig("webstorm", "jetbrains"),
+        "phpstorm": EditorConfig("phpstorm", "jetbrains"),
+        "goland": EditorConfig("goland", "jetbrains"),
+        "rider": EditorConfig("rider", "jetbrains"),
+        "clion": EditorConfig("clion", "jetbrains"),
+        "rubymine": EditorConfig("rubymine", "jetbrains"),
+    }
+)
 
 
 def detect_editor_config(editor_name: str) -> EditorConfig:
@@ -86,8 +93,8 @@ def detect_editor_config(editor_name: str) -> EditorConfig:
         >>> detect_editor_config("unknown-editor").syntax_type
         'vim'
     """
-    # Extract base name from path
-    base_name = Path(editor_name).stem.lower()
+    # Extract base name from path (string ops avoid building a Path per call)
+    base_name = os.path.splitext(os.path.basename(editor_name))[0].lower()
 
     # Handle .exe extension on Windows
     if base_name.endswith(".exe"):
@@ -125,11 +132,8 @@ def validate_editor_name(editor: str) -> bool:
         >>> validate_editor_name("vim && rm -rf /")
         False
     """
-    if not editor:
-        return False
-
     # Check against safe pattern (alphanumeric + /.-_ only)
-    return bool(EDITOR_NAME_PATTERN.match(editor))
+    return bool(editor) and _editor_name_ok(editor) is not None
 
 
 def build_editor_command(
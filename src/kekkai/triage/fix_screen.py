@@ -6,7 +6,9 @@ and preview of AI-generated patches.
 
 from __future__ import annotations
 
+import functools
 import os
+import shutil
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -23,6 +25,12 @@ if TYPE_CHECKING:
 __all__ = ["FixGenerationScreen"]
 
 
+@functools.lru_cache(maxsize=1)
+def _ollama_available() -> bool:
+    """Check if Ollama is available on the system (PATH is scanned once per process)."""
+    return shutil.which("ollama") is not None
+
+
 class FixGenerationScreen(ModalScreen[bool]):
     """Modal screen for generating AI-powered fixes.
 
@@ -89,19 +97,24 @@ class FixGenerationScreen(ModalScreen[bool]):
         self.on_fix_generated = on_fix_generated
         self.fix_preview: str | None = None
         self.fix_generated = False
+        # Backend configuration snapshot, read once per modal
+        self._api_key = os.environ.get("KEKKAI_FIX_API_KEY")
+        self._model_name_env = os.environ.get("KEKKAI_FIX_MODEL_NAME", "mistral")
+        self._has_ollama = _ollama_available()
 
     def compose(self) -> ComposeResult:
         with Vertical(id="fix-dialog"):
             yield Label("🤖 AI-Powered Fix Generation", id="fix-title")
             with VerticalScroll(id="fix-content"):
-                yield Label(self._get_finding_summary())
-                yield Label(self._get_model_info())
+                yield Label(self._finding_summary)
+                yield Label(self._model_info)
                 yield Static("", id="fix-preview")
-            yield Static(self._get_initial_status(), id="fix-status")
+            yield Static(self._initial_status, id="fix-status")
             yield Footer()
 
-    def _get_finding_summary(self) -> Text:
-        """Generate summary of finding to fix."""
+    @functools.cached_property
+    def _finding_summary(self) -> Text:
+        """Summary of finding to fix (built once; the finding is fixed per modal)."""
         text = Text()
         text.append("Finding:\n", style="bold")
         text.append(f"  {self.finding.scanner}: ", style="cyan")
@@ -113,17 +126,18 @@ class FixGenerationScreen(ModalScreen[bool]):
             text.append("\n")
         return text
 
-    def _get_model_info(self) -> Text:
-        """Display model configuration info."""
+    @functools.cached_property
+    def _model_info(self) -> Text:
+        """Model configuration info (built once from the init-time snapshot)."""
         text = Text()
         text.append("\nModel Configuration:\n", style="bold")
 
         # Check for Ollama
-        if self._is_ollama_available():
+        if self._has_ollama:
             text.append("  ✓ Ollama detected (local-first AI)\n", style="green")
             text.append("  No API keys needed - runs on your machine\n", style="dim")
         # Check for API keys
-        elif os.environ.get("KEKKAI_FIX_API_KEY"):
+        elif self._api_key:
             text.append("  ⚠ Using remote API (OpenAI/Anthropic)\n", style="yellow")
             text.append("  Code will be sent to external service\n", style="dim")
         else:
@@ -132,9 +146,10 @@ class FixGenerationScreen(ModalScreen[bool]):
 
         return text
 
-    def _get_initial_status(self) -> Text:
-        """Initial status message."""
-        if self._is_ollama_available() or os.environ.get("KEKKAI_FIX_API_KEY"):
+    @functools.cached_property
+    def _initial_status(self) -> Text:
+        """Initial status message (built once from the init-time snapshot)."""
+        if self._has_ollama or self._api_key:
             return Text("Press Enter to generate fix, or Escape to cancel", style="italic")
         else:
             return Text(
@@ -143,15 +158,9 @@ class FixGenerationScreen(ModalScreen[bool]):
                 style="red",
             )
 
-    def _is_ollama_available(self) -> bool:
-        """Check if Ollama is available on the system."""
-        import shutil
-
-        return shutil.which("ollama") is not None
-
     def on_mount(self) -> None:
         """Auto-generate fix if backend is available."""
-        if self._is_ollama_available() or os.environ.get("KEKKAI_FIX_API_KEY"):
+        if self._has_ollama or self._api_key:
             # Auto-start fix generation
             self.set_timer(0.5, self._generate_fix)
 
@@ -161,13 +170,13 @@ class FixGenerationScreen(ModalScreen[bool]):
         status.update(Text("⏳ Generating fix with AI...", style="yellow italic"))
 
         try:
-            # Import fix engine
+            # Deferred import: kekkai.fix loads the full fix engine on first use
             from ..fix import FixConfig
 
             # Determine model mode
-            if self._is_ollama_available():
+            if self._has_ollama:
                 model_mode = "ollama"
-                model_name = os.environ.get("KEKKAI_FIX_MODEL_NAME", "mistral")
+                model_name = self._model_name_env
             else:
                 model_mode = "openai"
                 model_name = None
@@ -176,7 +185,7 @@ class FixGenerationScreen(ModalScreen[bool]):
             _config = FixConfig(
                 model_mode=model_mode,
                 model_name=model_name,
-                api_key=os.environ.get("KEKKAI_FIX_API_KEY"),
+                api_key=self._api_key,
                 max_fixes=1,
                 timeout_seconds=60,
                 dry_run=True,
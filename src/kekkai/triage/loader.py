@@ -8,12 +8,14 @@ Supports loading findings from:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from ..scanners.base import Finding
+    from ..scanners.base import Finding, Scanner
     from ..scanners.base import Severity as ScannerSeverity
 
 from .models import FindingEntry
@@ -54,75 +56,82 @@ def load_findings_from_path(
     errors: list[str] = []
 
     # Determine input type
+    files: list[tuple[Path, os.DirEntry[str] | None]]
     if path.is_dir():
+        # One directory read; entries carry their own (cached) stat result
+        with os.scandir(path) as it:
+            entries = {e.name: e for e in it if e.name.endswith(".json") and e.is_file()}
+
         # Priority 1: Check for unified report first
-        unified_report = path / "kekkai-report.json"
-        if unified_report.exists():
-            files = [unified_report]
+        if "kekkai-report.json" in entries:
+            selected = [entries["kekkai-report.json"]]
         else:
             # Priority 2: Prefer canonical scan outputs
-            files = sorted(path.glob("*-results.json"))
-            if not files:
+            selected = [e for n, e in entries.items() if n.endswith("-results.json")]
+            if not selected:
                 # Priority 3: Fallback to all JSON (excluding metadata files)
-                files = sorted(
-                    [
-                        p
-                        for p in path.glob("*.json")
-                        if p.name not in ("run.json", "policy-result.json")
-                    ]
-                )
+                selected = [
+                    e for n, e in entries.items() if n not in ("run.json", "policy-result.json")
+                ]
+        selected.sort(key=lambda e: e.name)
+        files = [(path / e.name, e) for e in selected]
     else:
-        files = [path]
+        files = [(path, None)]
 
-    findings: list[FindingEntry] = []
-    for file in files:
-        # Check if file exists first
-        if not file.exists():
+    # Deduplicate by stable key while loading (first occurrence wins)
+    deduped: dict[str, FindingEntry] = {}
+    for file, entry in files:
+        # Size check (DoS mitigation per ASVS V10.3.3); a missing file fails here
+        try:
+            size = entry.stat().st_size if entry is not None else file.stat().st_size
+        except OSError:
             errors.append(f"{file.name}: OSError")
             continue
-
-        # Size check (DoS mitigation per ASVS V10.3.3)
-        size_mb = file.stat().st_size / (1024 * 1024)
+        size_mb = size / (1024 * 1024)
         if size_mb > MAX_FILE_SIZE_MB:
             msg = f"{file.name}: file too large ({size_mb:.1f} MB, max {MAX_FILE_SIZE_MB} MB)"
             errors.append(msg)
             continue
+        if size == 0:
+            continue
 
         try:
-            content = file.read_text(encoding="utf-8")
-            if not content.strip():
+            # Parse from bytes: json detects the UTF encoding itself, so no
+            # intermediate read_text() str copy is materialized. The bytes are
+            # kept so scanner parsers get the original text, not a re-dump.
+            raw = file.read_bytes()
+            data = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            if not exc.doc.strip():
+                # Whitespace-only file: treat like an empty one
                 continue
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError) as exc:
             # ASVS V7.4.1: Don't leak full path, only filename
             errors.append(f"{file.name}: {type(exc).__name__}")
             continue
+        except (OSError, UnicodeDecodeError) as exc:
+            errors.append(f"{file.name}: {type(exc).__name__}")
+            continue
 
         # Detect format and parse
         try:
-            batch = _parse_findings(data, file.stem)
-            findings.extend(batch)
+            batch = _parse_findings(data, file.stem, raw)
         except Exception as exc:
             errors.append(f"{file.name}: unsupported format ({str(exc)[:50]})")
+            continue
 
-    # Deduplicate by stable key
-    seen: set[str] = set()
-    deduped: list[FindingEntry] = []
-    for f in findings:
-        key = f"{f.scanner}:{f.rule_id}:{f.file_path}:{f.line}"
-        if key not in seen:
-            seen.add(key)
-            deduped.append(f)
+        for f in batch:
+            deduped.setdefault(f"{f.scanner}:{f.rule_id}:{f.file_path}:{f.line}", f)
 
-    return deduped, errors
+    return list(deduped.values()), errors
 
 
-def _parse_findings(data: Any, stem: str) -> list[FindingEntry]:
+def _parse_findings(data: Any, stem: str, raw: bytes) -> list[FindingEntry]:
     """Parse findings from JSON data.
 
     Args:
         data: Parsed JSON data.
         stem: File stem (used to detect scanner type).
+        raw: Original file bytes that ``data`` was parsed from.
 
     Returns:
         List of FindingEntry objects.
@@ -142,21 +151,32 @@ def _parse_findings(data: Any, stem: str) -> list[FindingEntry]:
     # Try scanner-specific format
     scanner_name = stem.replace("-results", "")
 
-    # Lazy import to avoid circular dependency
-    from ..cli import _create_scanner
-
-    scanner = _create_scanner(scanner_name)
+    scanner = _scanner_for(scanner_name)
     if not scanner:
         raise ValueError(f"Unknown scanner: {scanner_name}")
 
-    # Use canonical scanner parser (reuses validated logic)
-    raw_json = json.dumps(data)
+    # Use canonical scanner parser (reuses validated logic) on the original
+    # text; detect_encoding also strips a UTF-8 BOM that json.loads tolerated
+    raw_json = raw.decode(json.detect_encoding(raw))
     canonical_findings = scanner.parse(raw_json)
 
     # Convert to triage format
     return [_finding_to_entry(f) for f in canonical_findings]
 
 
+@functools.lru_cache(maxsize=16)
+def _scanner_for(name: str) -> Scanner | None:
+    """Return a shared parser-only scanner instance for a scanner name.
+
+    Scanner parse() is stateless, so one instance per scanner type is
+    reused across all files in a run directory.
+    """
+    # Lazy import to avoid circular dependency
+    from ..cli import _create_scanner
+
+    return _create_scanner(name)
+
+
 def _finding_to_entry(f: Finding) -> FindingEntry:
     """Convert scanner Finding to triage FindingEntry.
 
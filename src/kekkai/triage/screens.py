@@ -6,9 +6,12 @@ with keyboard navigation and action handling.
 
 from __future__ import annotations
 
+import functools
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from rich.style import Style
 from rich.syntax import Syntax
 from rich.text import Text
 from textual.app import ComposeResult
@@ -17,13 +20,16 @@ from textual.containers import Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Label, Static, TextArea
 
-from .code_context import CodeContextExtractor
+from .code_context import CodeContext, CodeContextExtractor
 from .models import TriageState
 from .widgets import FindingCard, sanitize_display
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from textual.timer import Timer
+    from textual.widget import Widget
+
     from .models import FindingEntry
 
 __all__ = [
@@ -31,6 +37,55 @@ __all__ = [
     "FindingDetailScreen",
 ]
 
+# Rows taken by one card in the list: 4 text rows + padding + border (8)
+# plus the 1-row bottom margin. FindingCard.render never wraps its rows. Cards are pinned to this height so the
+# list can map scroll offsets to finding indices without measuring.
+CARD_HEIGHT = 9
+
+# Cards mounted above and below the viewport to hide mount latency.
+CARD_OVERSCAN = 3
+
+# Cards scrolled out of the window stay mounted but hidden, up to this many.
+CARD_CACHE_SIZE = 64
+
+# Status bar renderables kept for recently seen (total, per-state) counts.
+STATUS_CACHE_SIZE = 16
+
+# Status bar updates are coalesced to at most one per frame (~60 Hz).
+STATUS_REFRESH_DELAY = 0.016
+
+# Extracted code windows kept per detail screen, keyed by location and mtime.
+CONTEXT_CACHE_SIZE = 16
+
+# Seconds to wait after an expand/shrink press so held keys re-extract once.
+CONTEXT_REFRESH_DELAY = 0.05
+
+
+# Status bar layout as (label template, style); counts are filled in per render.
+_STATUS_SEGMENTS: tuple[tuple[str, Style], ...] = (
+    ("Total: {} | ", Style(bold=True)),
+    ("Pending: {} | ", Style.null()),
+    ("FP: {} | ", Style(color="green")),
+    ("Confirmed: {} | ", Style(color="red")),
+    ("Deferred: {}", Style(color="yellow")),
+)
+
+# Detail screen action hints never change, so they are built once.
+_ACTION_HINTS = Text.assemble(
+    ("💡 Actions: ", "bold"),
+    ("Press ", "dim"),
+    ("X", "bold cyan"),
+    (" for AI-powered fix | ", "dim"),
+    ("Ctrl+O", "bold cyan"),
+    (" to open in ", "dim"),
+    ("$EDITOR", "italic"),
+    (" | ", "dim"),
+    ("E", "bold cyan"),
+    ("/", "dim"),
+    ("S", "bold cyan"),
+    (" to expand/shrink context", "dim"),
+)
+
 
 class FindingListScreen(Screen[None]):
     """Screen displaying paginated list of findings.
@@ -68,6 +123,12 @@ class FindingListScreen(Screen[None]):
         height: 1fr;
         padding: 1;
     }
+    #finding-list FindingCard {
+        height: 8;
+    }
+    #finding-list .list-spacer {
+        height: 0;
+    }
     #status-bar {
         dock: bottom;
         height: 3;
@@ -90,54 +151,190 @@ class FindingListScreen(Screen[None]):
         self.selected_index = 0
         self.on_state_change = on_state_change
         self.on_save = on_save
-        self._cards: list[FindingCard] = []
+        # Per-state totals for the status bar, adjusted as findings are marked
+        self._counts: Counter[TriageState] = Counter(f.state for f in findings)
+        self._status_cache: OrderedDict[tuple[int, int, int, int, int], Text] = OrderedDict()
+        self._status_refresh_pending = False
+        # State of the finding open in the detail screen when it was pushed
+        self._detail_previous_state: TriageState | None = None
+        # Only cards inside the visible window are shown, keyed by index.
+        self._cards: dict[int, FindingCard] = {}
+        # Recently hidden cards, least recently used first.
+        self._card_cache: OrderedDict[int, FindingCard] = OrderedDict()
+        self._window = (0, 0)
+        self._list = VerticalScroll(id="finding-list")
+        self._top_spacer = Static(classes="list-spacer")
+        self._bottom_spacer = Static(classes="list-spacer")
+        self._status_bar = Static(id="status-bar")
 
     def compose(self) -> ComposeResult:
         yield Header()
-        with VerticalScroll(id="finding-list"):
-            for i, finding in enumerate(self.findings):
-                card = FindingCard(finding, selected=(i == 0), id=f"card-{i}")
-                self._cards.append(card)
-                yield card
-        yield Static(self._status_text(), id="status-bar")
+        with self._list:
+            yield self._top_spacer
+            yield self._bottom_spacer
+        self._status_bar.update(self._status_text())
+        yield self._status_bar
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Mount the initial window and follow list scrolling."""
+        self._sync_window()
+        self.watch(self._list, "scroll_y", self._sync_window, init=False)
+
+    def on_resize(self) -> None:
+        """Grow or shrink the mounted window to the new viewport."""
+        self._sync_window()
+
+    def _visible_range(self) -> tuple[int, int]:
+        """Return the [first, last) finding indices to keep mounted."""
+        top = int(self._list.scroll_y) // CARD_HEIGHT
+        rows = self._list.scrollable_content_region.height
+        first = max(0, top - CARD_OVERSCAN)
+        last = min(len(self.findings), top + rows // CARD_HEIGHT + 1 + CARD_OVERSCAN)
+        return first, last
+
+    def _sync_window(self) -> None:
+        """Show cards entering the visible window and hide those leaving it.
+
+        Every card in the list, shown or hidden, is kept in finding order so
+        a cached card reappears in place by flipping ``display``.
+        """
+        first, last = self._visible_range()
+        if (first, last) == self._window:
+            return
+        self._window = (first, last)
+
+        for i in [i for i in self._cards if not first <= i < last]:
+            hidden = self._cards.pop(i)
+            hidden.display = False
+            self._card_cache[i] = hidden
+
+        self._top_spacer.styles.height = first * CARD_HEIGHT
+        self._bottom_spacer.styles.height = (len(self.findings) - last) * CARD_HEIGHT
+
+        run: list[FindingCard] = []
+        for i in range(first, last):
+            card = self._cards.get(i) or self._restore_card(i)
+            if card is None:
+                run.append(self._claim_card(i, first, last))
+            elif run:
+                self._place_cards(run, before=card)
+                run = []
+        if run:
+            following = [i for i in self._card_cache if i >= last]
+            anchor = self._card_cache[min(following)] if following else self._bottom_spacer
+            self._place_cards(run, before=anchor)
+
+        while len(self._card_cache) > CARD_CACHE_SIZE:
+            self._card_cache.popitem(last=False)[1].remove()
+
+    def _restore_card(self, index: int) -> FindingCard | None:
+        """Show the cached card for ``findings[index]``, if there is one."""
+        card = self._card_cache.pop(index, None)
+        if card is None:
+            return None
+        self._show_card(card, index)
+        return card
+
+    def _claim_card(self, index: int, first: int, last: int) -> FindingCard:
+        """Bind a card to ``findings[index]`` and register it as shown.
+
+        Once the hidden-card cache is full, its least recently used card
+        outside [first, last) is rebound instead of building a new widget,
+        so the number of cards stays bounded by the window plus the cache.
+        """
+        recyclable = None
+        if len(self._card_cache) >= CARD_CACHE_SIZE:
+            recyclable = next((i for i in self._card_cache if not first <= i < last), None)
+        if recyclable is None:
+            card = FindingCard(self.findings[index], selected=(index == self.selected_index))
+            self._cards[index] = card
+            return card
+
+        card = self._card_cache.pop(recyclable)
+        card.finding = self.findings[index]
+        self._show_card(card, index)
+        return card
+
+    def _show_card(self, card: FindingCard, index: int) -> None:
+        """Display ``card`` as the current card for ``findings[index]``."""
+        card.set_selected(index == self.selected_index)
+        card.display = True
+        card.refresh()
+        self._cards[index] = card
+
+    def _place_cards(self, cards: list[FindingCard], before: Widget) -> None:
+        """Insert ``cards`` in order ahead of ``before``, mounting new ones."""
+        for card in cards:
+            if card.parent is None:
+                self._list.mount(card, before=before)
+            else:
+                self._list.move_child(card, before=before)
+
+    def _scroll_to_index(self, index: int) -> None:
+        """Scroll the list just enough to bring ``findings[index]`` into view."""
+        top = index * CARD_HEIGHT
+        rows = self._list.scrollable_content_region.height
+        if top < self._list.scroll_y:
+            self._list.scroll_to(y=top, animate=False)
+        elif top + CARD_HEIGHT > self._list.scroll_y + rows:
+            self._list.scroll_to(y=top + CARD_HEIGHT - rows, animate=False)
+
     def _status_text(self) -> Text:
         """Generate status bar text."""
         total = len(self.findings)
         if total == 0:
             return Text("No findings to triage", style="dim")
 
-        counts = {s: 0 for s in TriageState}
-        for f in self.findings:
-            counts[f.state] += 1
+        counts = self._counts
+        key = (
+            total,
+            counts[TriageState.PENDING],
+            counts[TriageState.FALSE_POSITIVE],
+            counts[TriageState.CONFIRMED],
+            counts[TriageState.DEFERRED],
+        )
+        cached = self._status_cache.get(key)
+        if cached is not None:
+            self._status_cache.move_to_end(key)
+            return cached
+
+        text = Text.assemble(
+            *(
+                (label.format(n), style)
+                for (label, style), n in zip(_STATUS_SEGMENTS, key, strict=True)
+            )
+        )
 
-        text = Text()
-        text.append(f"Total: {total} | ", style="bold")
-        text.append(f"Pending: {counts[TriageState.PENDING]} | ")
-        text.append(f"FP: {counts[TriageState.FALSE_POSITIVE]} | ", style="green")
-        text.append(f"Confirmed: {counts[TriageState.CONFIRMED]} | ", style="red")
-        text.append(f"Deferred: {counts[TriageState.DEFERRED]}", style="yellow")
+        self._status_cache[key] = text
+        if len(self._status_cache) > STATUS_CACHE_SIZE:
+            self._status_cache.popitem(last=False)
         return text
 
     def _update_status(self) -> None:
+        """Schedule a status bar update, coalescing bursts to one per frame."""
+        if not self._status_refresh_pending:
+            self._status_refresh_pending = True
+            self.set_timer(STATUS_REFRESH_DELAY, self._update_status_now)
+
+    def _update_status_now(self) -> None:
         """Update status bar."""
-        status_bar = self.query_one("#status-bar", Static)
-        status_bar.update(self._status_text())
+        self._status_refresh_pending = False
+        self._status_bar.update(self._status_text())
 
     def _update_selection(self, new_index: int) -> None:
         """Update visual selection."""
-        if not self._cards:
+        if not self.findings:
             return
 
         old_index = self.selected_index
-        self.selected_index = max(0, min(new_index, len(self._cards) - 1))
+        self.selected_index = max(0, min(new_index, len(self.findings) - 1))
 
-        if old_index < len(self._cards):
-            self._cards[old_index].set_selected(False)
-        if self.selected_index < len(self._cards):
-            self._cards[self.selected_index].set_selected(True)
-            self._cards[self.selected_index].scroll_visible()
+        if old_card := self._cards.get(old_index):
+            old_card.set_selected(False)
+        if new_card := self._cards.get(self.selected_index):
+            new_card.set_selected(True)
+        self._scroll_to_index(self.selected_index)
 
     def action_cursor_down(self) -> None:
         """Move selection down."""
@@ -152,6 +349,7 @@ class FindingListScreen(Screen[None]):
         if not self.findings:
             return
         finding = self.findings[self.selected_index]
+        self._detail_previous_state = finding.state
         # Get repo_path and context_lines from app if available
         repo_path = getattr(self.app, "repo_path", None)
         context_lines = getattr(self.app, "context_lines", 10)
@@ -167,11 +365,16 @@ class FindingListScreen(Screen[None]):
     def _handle_detail_state_change(self, state: TriageState, notes: str) -> None:
         """Handle state change from detail screen."""
         if self.selected_index < len(self.findings):
-            self.findings[self.selected_index].state = state
-            self.findings[self.selected_index].notes = notes
-            self._cards[self.selected_index].finding = self.findings[self.selected_index]
-            self._cards[self.selected_index].refresh()
-            self._update_status()
+            # The detail screen has already written the new state to the finding
+            previous = self._detail_previous_state
+            self._detail_previous_state = None
+            if previous is not None:
+                self._count_transition(previous, state)
+            with self.app.batch_update():
+                self.findings[self.selected_index].state = state
+                self.findings[self.selected_index].notes = notes
+                self._refresh_card(self.selected_index)
+                self._update_status()
             if self.on_state_change:
                 self.on_state_change(self.selected_index, state)
 
@@ -179,13 +382,29 @@ class FindingListScreen(Screen[None]):
         """Mark selected finding with given state."""
         if not self.findings:
             return
-        self.findings[self.selected_index].state = state
-        self._cards[self.selected_index].finding = self.findings[self.selected_index]
-        self._cards[self.selected_index].refresh()
-        self._update_status()
+        self._count_transition(self.findings[self.selected_index].state, state)
+        with self.app.batch_update():
+            self.findings[self.selected_index].state = state
+            self._refresh_card(self.selected_index)
+            self._update_status()
         if self.on_state_change:
             self.on_state_change(self.selected_index, state)
 
+    def _count_transition(self, old: TriageState, new: TriageState) -> None:
+        """Move one finding between state totals."""
+        self._counts[old] -= 1
+        self._counts[new] += 1
+
+    def _refresh_card(self, index: int) -> None:
+        """Redraw the card for ``findings[index]`` if it is mounted.
+
+        Off-screen cards need no work: they are built from the current
+        finding when they scroll back into view.
+        """
+        if card := self._cards.get(index):
+            card.finding = self.findings[index]
+            card.refresh()
+
     def action_mark_false_positive(self) -> None:
         """Mark as false positive."""
         self._mark_state(TriageState.FALSE_POSITIVE)
@@ -255,7 +474,7 @@ class FindingDetailScreen(Screen[None]):
     }
     .error-message {
         color: $warning;
-        italic: true;
+        text-style: italic;
     }
     #action-hints {
         height: auto;
@@ -285,7 +504,22 @@ class FindingDetailScreen(Screen[None]):
         self.on_state_change = on_state_change
         self.repo_path = repo_path or Path.cwd()
         self.context_lines = context_lines
-        self._code_extractor = CodeContextExtractor(self.repo_path)
+        # Highlighted code keyed by (language, code); expand/shrink revisit the same windows
+        self._syntax_cache: dict[tuple[str, str], Syntax] = {}
+        self._shown_code: Syntax | str | None = None
+        self._code_widget: Static | None = None
+        self._notes_area: TextArea | None = None
+        self._context_cache: OrderedDict[tuple[str, int, int, float], CodeContext | None] = (
+            OrderedDict()
+        )
+        # Set when context_lines changes; cleared once the code pane is redrawn
+        self._context_dirty = False
+        self._context_timer: Timer | None = None
+
+    @functools.cached_property
+    def _code_extractor(self) -> CodeContextExtractor:
+        """Code context extractor, built when a finding first needs it."""
+        return CodeContextExtractor(self.repo_path)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -301,7 +535,8 @@ class FindingDetailScreen(Screen[None]):
             # Add action hints to make workflow discoverable
             yield Static(self._action_hints(), id="action-hints")
             yield Label("Notes (will be saved with decision):")
-            yield TextArea(self.finding.notes, id="notes-area")
+            self._notes_area = TextArea(self.finding.notes, id="notes-area")
+            yield self._notes_area
         yield Footer()
 
     def _header_text(self) -> Text:
@@ -353,11 +588,7 @@ class FindingDetailScreen(Screen[None]):
 
     def _get_notes(self) -> str:
         """Get notes from text area."""
-        try:
-            notes_area = self.query_one("#notes-area", TextArea)
-            return notes_area.text
-        except Exception:
-            return ""
+        return self._notes_area.text if self._notes_area else ""
 
     def _mark_and_close(self, state: TriageState) -> None:
         """Mark state and close screen."""
@@ -385,20 +616,7 @@ class FindingDetailScreen(Screen[None]):
 
     def _action_hints(self) -> Text:
         """Generate action hints to make workflow discoverable."""
-        text = Text()
-        text.append("💡 Actions: ", style="bold")
-        text.append("Press ", style="dim")
-        text.append("X", style="bold cyan")
-        text.append(" for AI-powered fix | ", style="dim")
-        text.append("Ctrl+O", style="bold cyan")
-        text.append(" to open in ", style="dim")
-        text.append("$EDITOR", style="italic")
-        text.append(" | ", style="dim")
-        text.append("E", style="bold cyan")
-        text.append("/", style="dim")
-        text.append("S", style="bold cyan")
-        text.append(" to expand/shrink context", style="dim")
-        return text
+        return _ACTION_HINTS
 
     def action_fix_with_ai(self) -> None:
         """Trigger AI-powered fix generation (workbench: step 2)."""
@@ -518,33 +736,98 @@ class FindingDetailScreen(Screen[None]):
         self.notify(f"Context shrunk to {self.context_lines} lines", severity="information")
 
     def _refresh_code_context(self) -> None:
+        """Schedule a code context redraw for the new context_lines setting.
+
+        Rapid presses within CONTEXT_REFRESH_DELAY share one redraw. While
+        the screen is not shown the redraw waits until it is resumed.
+        """
+        self._context_dirty = True
+        if self._context_timer is None and self.is_attached and self.is_current:
+            self._context_timer = self.set_timer(CONTEXT_REFRESH_DELAY, self._apply_code_context)
+
+    def on_screen_resume(self) -> None:
+        """Redraw code context changed while another screen was on top."""
+        if self._context_dirty:
+            self._apply_code_context()
+
+    def _apply_code_context(self) -> None:
         """Refresh code context display with new context_lines setting."""
         import logging
 
         logger = logging.getLogger(__name__)
 
-        try:
-            # Update the prompt builder's context lines
-            self._code_extractor._prompt_builder.context_lines = self.context_lines
+        self._context_timer = None
+        if not self._context_dirty:
+            return
+        self._context_dirty = False
 
-            # Re-render code context
-            code_widget = self._render_code_context()
-            if code_widget:
-                # Find and update the existing widget
-                try:
-                    old_widget = self.query_one("#code-context-display")
-                    # Replace content by removing old and adding new
-                    old_widget.remove()
-                    # Find the label and insert after it
-                    container = self.query_one("#detail-container")
-                    container.mount(code_widget)
-                except Exception as e:
-                    # Widget not found or couldn't refresh
-                    logger.debug("code_context_refresh_failed", extra={"error": str(e)})
+        # Only a mounted highlighted pane can change; error and absent panes stay as composed
+        code_widget = self._code_widget
+        if code_widget is None or not self.finding.file_path or not self.finding.line:
+            return
+
+        try:
+            context = self._extract_context(self.finding.file_path, self.finding.line)
+            if not context or context.error:
+                return
+
+            code = self._code_renderable(context)
+            if code is not self._shown_code:
+                # Swap the renderable in place rather than remounting the widget
+                code_widget.update(code)
+                self._shown_code = code
         except Exception as e:
             # Refresh failed, log but don't crash
             logger.debug("code_context_update_failed", extra={"error": str(e)})
 
+    def _extract_context(self, file_path: str, line: int) -> CodeContext | None:
+        """Extract code context at the current context_lines, reusing recent results.
+
+        Results are keyed by the file's mtime so an edit on disk (for example
+        from $EDITOR) invalidates them.
+        """
+        key: tuple[str, int, int, float] | None = None
+        try:
+            key = (
+                file_path,
+                line,
+                self.context_lines,
+                (self.repo_path / file_path).stat().st_mtime,
+            )
+        except (OSError, ValueError):
+            pass  # Unreadable paths are left to extract() to report, uncached
+        if key is not None and key in self._context_cache:
+            self._context_cache.move_to_end(key)
+            return self._context_cache[key]
+
+        self._code_extractor._prompt_builder.context_lines = self.context_lines
+        context = self._code_extractor.extract(file_path, line)
+        if key is not None:
+            self._context_cache[key] = context
+            if len(self._context_cache) > CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+        return context
+
+    def _code_renderable(self, context: CodeContext) -> Syntax | str:
+        """Return syntax-highlighted code for ``context``, reusing earlier results."""
+        key = (context.language, context.code)
+        syntax = self._syntax_cache.get(key)
+        if syntax is not None:
+            return syntax
+        try:
+            syntax = Syntax(
+                context.code,
+                context.language,
+                line_numbers=False,  # We already have line numbers in the context
+                theme="monokai",
+                word_wrap=False,
+            )
+        except Exception:
+            # Fallback to plain text if syntax highlighting fails
+            return context.code
+        self._syntax_cache[key] = syntax
+        return syntax
+
     def _render_code_context(self) -> Static | None:
         """Render code context with syntax highlighting.
 
@@ -560,23 +843,13 @@ class FindingDetailScreen(Screen[None]):
         if not self.finding.file_path or not self.finding.line:
             return None
 
-        context = self._code_extractor.extract(self.finding.file_path, self.finding.line)
+        context = self._extract_context(self.finding.file_path, self.finding.line)
         if not context:
             return None
 
         if context.error:
             return Static(f"Code unavailable: {context.error}", classes="error-message")
 
-        # Create syntax-highlighted code display
-        try:
-            syntax = Syntax(
-                context.code,
-                context.language,
-                line_numbers=False,  # We already have line numbers in the context
-                theme="monokai",
-                word_wrap=False,
-            )
-            return Static(syntax, id="code-context-display")
-        except Exception:
-            # Fallback to plain text if syntax highlighting fails
-            return Static(context.code, id="code-context-display")
+        self._shown_code = self._code_renderable(context)
+        self._code_widget = Static(self._shown_code, id="code-context-display")
+        return self._code_widget
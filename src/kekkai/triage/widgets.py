@@ -130,35 +130,39 @@ class FindingCard(Static):
             self.add_class("selected")
 
     def render(self) -> Text:
-        """Render the finding card."""
-        text = Text()
+        """Render the finding card.
 
+        Each row is cut to the card width with an ellipsis rather than
+        wrapped: the list pins cards to a fixed height, so a wrapped
+        title or rule ID would push the file row out of view.
+        """
+        header = Text()
         severity_style = SEVERITY_STYLES.get(self.finding.severity.value, "dim")
-        text.append(f" {self.finding.severity.value.upper()} ", style=severity_style)
-        text.append(" ")
-
+        header.append(f" {self.finding.severity.value.upper()} ", style=severity_style)
+        header.append(" ")
         state_style = STATE_STYLES.get(self.finding.state.value, "dim")
         state_label = STATE_LABELS.get(self.finding.state.value, "")
-        text.append(f"[{state_label}]", style=state_style)
-        text.append("\n")
+        header.append(f"[{state_label}]", style=state_style)
 
-        title = sanitize_display(self.finding.title, max_length=80)
-        text.append(title, style="bold")
-        text.append("\n")
+        title = Text(sanitize_display(self.finding.title, max_length=80), style="bold")
 
         scanner = sanitize_display(self.finding.scanner)
         rule_id = sanitize_display(self.finding.rule_id)
-        text.append(f"Scanner: {scanner}", style="dim")
+        source = Text(f"Scanner: {scanner}", style="dim")
         if rule_id:
-            text.append(f" | Rule: {rule_id}", style="dim")
-        text.append("\n")
+            source.append(f" | Rule: {rule_id}", style="dim")
 
+        rows = [header, title, source]
         if self.finding.file_path:
             file_path = sanitize_display(self.finding.file_path, max_length=60)
             line_info = f":{self.finding.line}" if self.finding.line else ""
-            text.append(f"File: {file_path}{line_info}", style="cyan")
+            rows.append(Text(f"File: {file_path}{line_info}", style="cyan"))
 
-        return text
+        width = self.size.width
+        if width:
+            for row in rows:
+                row.truncate(width, overflow="ellipsis")
+        return Text("\n").join(rows)
 
     def set_selected(self, selected: bool) -> None:
         """Update selection state."""
@@ -1,9 +1,10 @@
 """Metadata extraction utilities for CI/CD distribution triggers."""
 
 import hashlib
-import re
 from pathlib import Path
 
+from kekkai_core.ci.validators import validate_semver
+
 
 def extract_version_from_tag(tag: str) -> str:
     """
@@ -25,8 +26,7 @@ def extract_version_from_tag(tag: str) -> str:
     version = tag[1:] if tag.startswith("v") else tag
 
     # Validate basic semver pattern (with optional pre-release and build metadata)
-    pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?(\+[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$"
-    if not re.match(pattern, version):
+    if not validate_semver(version):
         raise ValueError(f"Invalid tag format: {tag}. Expected format: v0.0.1 or v0.0.1-rc1")
 
     return version
@@ -49,13 +49,9 @@ def calculate_sha256(file_path: Path) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    sha256_hash = hashlib.sha256()
     with file_path.open("rb") as f:
-        # Read in 64KB chunks for memory efficiency
-        for chunk in iter(lambda: f.read(65536), b""):
-            sha256_hash.update(chunk)
-
-    return sha256_hash.hexdigest()
+        # file_digest streams the file through the hash in C
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def extract_tarball_url(repo: str, version: str) -> str:
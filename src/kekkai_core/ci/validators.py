@@ -3,6 +3,12 @@
 import re
 from pathlib import Path
 
+# Strict semver: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
+_SEMVER_PATTERN = re.compile(
+    r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?(\+[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$"
+)
+_REPO_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+$")
+
 
 def validate_semver(version: str) -> bool:
     """
@@ -24,9 +30,7 @@ def validate_semver(version: str) -> bool:
         >>> validate_semver("1.2")
         False
     """
-    # Strict semver: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
-    pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?(\+[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$"
-    return bool(re.match(pattern, version))
+    return bool(_SEMVER_PATTERN.match(version))
 
 
 def verify_checksum(file_path: Path, expected_sha256: str) -> bool:
@@ -67,8 +71,7 @@ def validate_repo_format(repo: str) -> bool:
         >>> validate_repo_format("kademoslabs/kekkai/extra")
         False
     """
-    pattern = r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+$"
-    return bool(re.match(pattern, repo))
+    return bool(_REPO_PATTERN.match(repo))
 
 
 def validate_github_token(token: str) -> bool:
@@ -2,11 +2,21 @@
 
 import json
 import subprocess
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, Literal
 
 SeverityLevel = Literal["CRITICAL", "HIGH", "MEDIUM", "LOW", "UNKNOWN"]
 
+_SEVERITY_ORDER: dict[SeverityLevel, int] = {
+    "CRITICAL": 4,
+    "HIGH": 3,
+    "MEDIUM": 2,
+    "LOW": 1,
+    "UNKNOWN": 0,
+}
+
 
 class TrivyScanError(Exception):
     """Raised when Trivy scan fails."""
@@ -68,6 +78,20 @@ def run_trivy_scan(
         raise TrivyScanError(f"Trivy scan failed: {e}") from e
 
 
+def _iter_vulnerabilities(
+    scan_results: dict[str, Any],
+    severity_threshold: SeverityLevel,
+) -> Iterator[dict[str, Any]]:
+    """Yield vulnerabilities at or above the threshold, in scan order."""
+    threshold_level = _SEVERITY_ORDER.get(severity_threshold, 0)
+
+    # Trivy JSON format has "Results" array
+    for result in scan_results.get("Results", []):
+        for vuln in result.get("Vulnerabilities", []):
+            if _SEVERITY_ORDER.get(vuln.get("Severity", "UNKNOWN"), 0) >= threshold_level:
+                yield vuln
+
+
 def filter_vulnerabilities(
     scan_results: dict[str, Any],
     severity_threshold: SeverityLevel = "HIGH",
@@ -82,29 +106,7 @@ def filter_vulnerabilities(
     Returns:
         List of vulnerabilities meeting threshold
     """
-    severity_order: dict[SeverityLevel, int] = {
-        "CRITICAL": 4,
-        "HIGH": 3,
-        "MEDIUM": 2,
-        "LOW": 1,
-        "UNKNOWN": 0,
-    }
-
-    threshold_level = severity_order.get(severity_threshold, 0)
-    filtered: list[dict[str, Any]] = []
-
-    # Trivy JSON format has "Results" array
-    results = scan_results.get("Results", [])
-
-    for result in results:
-        vulnerabilities = result.get("Vulnerabilities", [])
-        for vuln in vulnerabilities:
-            severity = vuln.get("Severity", "UNKNOWN")
-            severity_value = severity_order.get(severity, 0)
-            if severity_value >= threshold_level:
-                filtered.append(vuln)
-
-    return filtered
+    return list(_iter_vulnerabilities(scan_results, severity_threshold))
 
 
 def count_vulnerabilities_by_severity(
@@ -119,25 +121,12 @@ def count_vulnerabilities_by_severity(
     Returns:
         Dictionary mapping severity to count
     """
-    counts: dict[SeverityLevel, int] = {
-        "CRITICAL": 0,
-        "HIGH": 0,
-        "MEDIUM": 0,
-        "LOW": 0,
-        "UNKNOWN": 0,
-    }
-
-    results = scan_results.get("Results", [])
-
-    for result in results:
-        vulnerabilities = result.get("Vulnerabilities", [])
-        for vuln in vulnerabilities:
-            severity = vuln.get("Severity", "UNKNOWN")
-            if severity in counts:
-                severity_key = cast(SeverityLevel, severity)
-                counts[severity_key] += 1
-
-    return counts
+    tally = Counter(
+        vuln.get("Severity", "UNKNOWN")
+        for result in scan_results.get("Results", [])
+        for vuln in result.get("Vulnerabilities", [])
+    )
+    return {severity: tally[severity] for severity in _SEVERITY_ORDER}
 
 
 def has_critical_vulnerabilities(
@@ -154,5 +143,4 @@ def has_critical_vulnerabilities(
     Returns:
         True if vulnerabilities found at or above threshold
     """
-    filtered = filter_vulnerabilities(scan_results, severity_threshold)
-    return len(filtered) > 0
+    return next(_iter_vulnerabilities(scan_results, severity_threshold), None) is not None
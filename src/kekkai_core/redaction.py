@@ -8,6 +8,23 @@ _SECRET_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"(?i)\b(bearer)\s+([a-z0-9\-\._~\+\/]+=*)"),
 ]
 
+# Both core patterns as one alternation so redact() scans the text once.
+# A bearer value that embeds a key=value pair is consumed through that value;
+# otherwise the scan would resume mid-pair and leave the value in place.
+_SECRET_KEYS = r"api[_-]?key|token|secret|password"
+_BEARER_CHARS = r"[a-z0-9\-\._~\+\/]"
+_COMBINED_SECRET_PATTERN: re.Pattern[str] = re.compile(
+    rf"(?P<key>{_SECRET_KEYS})\s*[:=]\s*[^\s,;]+"
+    rf"|\b(?P<scheme>bearer)\s+"
+    rf"(?:{_BEARER_CHARS}*?(?:{_SECRET_KEYS})\s*[:=]\s*[^\s,;]+|{_BEARER_CHARS}+=*)",
+    re.IGNORECASE,
+)
+
+# Every core match contains one of these words. Checking them on the casefolded
+# text is far cheaper than a regex scan and lets clean strings skip it entirely;
+# casefold (not lower) agrees with IGNORECASE on look-alikes such as U+017F.
+_SECRET_TRIGGER_WORDS = ("key", "token", "secret", "password", "bearer")
+
 # Extended patterns for comprehensive secret detection
 _EXTENDED_PATTERNS: list[re.Pattern[str]] = [
     # AWS keys
@@ -33,10 +50,15 @@ _EXTENDED_PATTERNS: list[re.Pattern[str]] = [
 
 def redact(text: str) -> str:
     """Redact likely secrets from a string (best-effort, non-destructive)."""
-    redacted = text
-    for pat in _SECRET_PATTERNS:
-        redacted = pat.sub(lambda m: f"{m.group(1)} [REDACTED]", redacted)
-    return redacted
+    folded = text.casefold()
+    if not any(word in folded for word in _SECRET_TRIGGER_WORDS):
+        return text
+    return _COMBINED_SECRET_PATTERN.sub(_redact_match, text)
+
+
+def _redact_match(match: re.Match[str]) -> str:
+    """Keep the key or auth scheme of a secret match and drop its value."""
+    return f"{match[match.lastgroup or 0]} [REDACTED]"
 
 
 def redact_extended(text: str) -> str:
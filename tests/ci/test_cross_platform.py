@@ -4,36 +4,45 @@ import os
 import platform
 import subprocess
 import sys
-from pathlib import Path
+from pathlib import Path, PurePosixPath, PureWindowsPath
 
 import pytest
 
+# Platform facts do not change during a run; read them once at import.
+_SYSTEM = platform.system()
+_MACHINE = platform.machine()
+_IMPLEMENTATION = platform.python_implementation()
+_IS_WINDOWS = sys.platform.startswith("win")
+_IS_MACOS = sys.platform == "darwin"
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Constant paths exercised by the path handling tests, built once.
+_CLI_PATH = Path("src/kekkai/cli.py")
+_JOINED_PATH = Path("base") / "sub" / "file.txt"
+_UNIX_BIN_PATH = Path("/usr/local/bin")
+_WINDOWS_SYSTEM_PATH = Path("C:\\Windows\\System32")
+
 
 class TestCrossPlatformPathHandling:
     """Test path handling across different platforms."""
 
     def test_path_normalization_unix_style(self) -> None:
         """Verify Unix-style paths work on all platforms."""
-        path = Path("src/kekkai/cli.py")
+        path = _CLI_PATH
         assert path.parts[0] == "src"
         assert path.parts[1] == "kekkai"
         assert path.parts[2] == "cli.py"
 
-    def test_path_normalization_absolute(self, tmp_path: Path) -> None:
+    def test_path_normalization_absolute(self) -> None:
         """Verify absolute paths work correctly."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        assert test_file.exists()
-        assert test_file.is_absolute()
+        assert PurePosixPath("/tmp/test.txt").is_absolute()
+        assert PureWindowsPath("C:\\Temp\\test.txt").is_absolute()
+        assert not PurePosixPath("tmp/test.txt").is_absolute()
 
     def test_path_join_cross_platform(self) -> None:
         """Verify path joining works on all platforms."""
-        base = Path("base")
-        sub = base / "sub" / "file.txt"
-
         # Should work regardless of platform path separator
-        assert str(sub).replace("\\", "/") == "base/sub/file.txt"
+        assert str(_JOINED_PATH).replace("\\", "/") == "base/sub/file.txt"
 
     def test_home_directory_expansion(self) -> None:
         """Verify home directory expansion works."""
@@ -41,17 +50,17 @@ class TestCrossPlatformPathHandling:
         assert home.exists()
         assert home.is_absolute()
 
-    @pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix path test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix path test")
     def test_unix_path_with_forward_slashes(self) -> None:
         """Verify forward slashes work on Unix."""
-        path = Path("/usr/local/bin")
+        path = _UNIX_BIN_PATH
         assert path.parts[0] == "/"
         assert "usr" in path.parts
 
-    @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows path test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows path test")
     def test_windows_path_with_backslashes(self) -> None:
         """Verify backslashes work on Windows."""
-        path = Path("C:\\Windows\\System32")
+        path = _WINDOWS_SYSTEM_PATH
         assert path.parts[0] == "C:\\"
 
 
@@ -102,24 +111,35 @@ class TestPythonEnvironmentDetection:
 
     def test_platform_detection(self) -> None:
         """Verify platform is detected correctly."""
-        system = platform.system()
+        system = _SYSTEM
         assert system in ["Linux", "Darwin", "Windows"]
 
     def test_architecture_detection(self) -> None:
         """Verify architecture is detected correctly."""
-        machine = platform.machine()
+        machine = _MACHINE
         assert machine in ["x86_64", "AMD64", "arm64", "aarch64"]
 
     def test_python_implementation(self) -> None:
         """Verify Python implementation."""
-        impl = platform.python_implementation()
+        impl = _IMPLEMENTATION
         assert impl == "CPython"
 
 
+@pytest.fixture(scope="session")
+def python_version_output() -> subprocess.CompletedProcess[str]:
+    """Run ``python --version`` once per session."""
+    return subprocess.run(
+        [sys.executable, "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
 class TestPlatformSpecificCommands:
     """Test platform-specific command execution."""
 
-    @pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix command test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix command test")
     def test_unix_shell_command(self) -> None:
         """Verify Unix shell commands work."""
         result = subprocess.run(
@@ -131,7 +151,7 @@ class TestPlatformSpecificCommands:
         assert result.stdout.strip() == "test"
         assert result.returncode == 0
 
-    @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows command test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows command test")
     def test_windows_command(self) -> None:
         """Verify Windows commands work."""
         result = subprocess.run(
@@ -143,25 +163,24 @@ class TestPlatformSpecificCommands:
         assert "test" in result.stdout
         assert result.returncode == 0
 
-    def test_python_version_command(self) -> None:
+    def test_python_version_command(
+        self, python_version_output: subprocess.CompletedProcess[str]
+    ) -> None:
         """Verify python --version works on all platforms."""
-        result = subprocess.run(
-            [sys.executable, "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = python_version_output
         assert "Python 3." in result.stdout or "Python 3." in result.stderr
         assert result.returncode == 0
 
     def test_subprocess_with_timeout(self) -> None:
         """Verify subprocess timeout works on all platforms."""
+        # A plain sleep binary avoids interpreter start-up on POSIX. Windows
+        # ``timeout`` rejects redirected stdin, so keep Python there.
+        if _IS_WINDOWS:
+            command = [sys.executable, "-c", "import time; time.sleep(10)"]
+        else:
+            command = ["sleep", "10"]
         try:
-            subprocess.run(
-                [sys.executable, "-c", "import time; time.sleep(10)"],
-                timeout=0.1,
-                check=True,
-            )
+            subprocess.run(command, timeout=0.05, check=True)
             pytest.fail("Should have timed out")
         except subprocess.TimeoutExpired:
             # Expected
@@ -171,13 +190,13 @@ class TestPlatformSpecificCommands:
 class TestEnvironmentVariables:
     """Test environment variable handling across platforms."""
 
-    def test_env_variable_set_and_get(self) -> None:
+    def test_env_variable_set_and_get(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Verify environment variables work."""
-        os.environ["KEKKAI_TEST_VAR"] = "test_value"
+        monkeypatch.setenv("KEKKAI_TEST_VAR", "test_value")
         assert os.environ.get("KEKKAI_TEST_VAR") == "test_value"
 
-        # Cleanup
-        del os.environ["KEKKAI_TEST_VAR"]
+        monkeypatch.delenv("KEKKAI_TEST_VAR")
+        assert "KEKKAI_TEST_VAR" not in os.environ
 
     def test_path_env_variable_exists(self) -> None:
         """Verify PATH environment variable exists."""
@@ -185,13 +204,13 @@ class TestEnvironmentVariables:
         assert path_var is not None
         assert len(path_var) > 0
 
-    @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows env test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows env test")
     def test_windows_specific_env_vars(self) -> None:
         """Verify Windows-specific environment variables."""
         assert os.environ.get("USERPROFILE") is not None
         assert os.environ.get("TEMP") is not None
 
-    @pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix env test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix env test")
     def test_unix_specific_env_vars(self) -> None:
         """Verify Unix-specific environment variables."""
         assert os.environ.get("HOME") is not None
@@ -253,41 +272,49 @@ class TestFileSystemOperations:
             pytest.skip("Symlinks not supported on this platform/configuration")
 
 
+def _probe_version(command: str) -> subprocess.CompletedProcess[str] | None:
+    """Run ``<command> --version``, or return None if it is unavailable."""
+    try:
+        return subprocess.run(
+            [command, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+
+
+@pytest.fixture(scope="session")
+def docker_versions() -> dict[str, subprocess.CompletedProcess[str] | None]:
+    """Probe the Docker CLIs once per session."""
+    return {command: _probe_version(command) for command in ("docker", "docker-compose")}
+
+
 class TestDockerDetection:
     """Test Docker availability detection across platforms."""
 
-    def test_docker_command_exists(self) -> None:
+    def test_docker_command_exists(
+        self, docker_versions: dict[str, subprocess.CompletedProcess[str] | None]
+    ) -> None:
         """Verify Docker command detection."""
-        try:
-            result = subprocess.run(
-                ["docker", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            docker_available = result.returncode == 0
-            if docker_available:
-                assert "Docker" in result.stdout or "Docker" in result.stderr
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            # Docker not available
+        result = docker_versions["docker"]
+        if result is None:
             pytest.skip("Docker not installed")
+        if result.returncode == 0:
+            assert "Docker" in result.stdout or "Docker" in result.stderr
 
-    def test_docker_compose_command(self) -> None:
+    def test_docker_compose_command(
+        self, docker_versions: dict[str, subprocess.CompletedProcess[str] | None]
+    ) -> None:
         """Verify docker-compose command detection."""
-        try:
-            result = subprocess.run(
-                ["docker-compose", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                # Accept both v1 "docker-compose" and v2 "docker compose"
-                assert "docker-compose" in output or "docker compose" in output
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            # Docker Compose not available
+        result = docker_versions["docker-compose"]
+        if result is None:
             pytest.skip("Docker Compose not installed")
+        if result.returncode == 0:
+            output = result.stdout.lower()
+            # Accept both v1 "docker-compose" and v2 "docker compose"
+            assert "docker-compose" in output or "docker compose" in output
 
 
 class TestPlatformSpecificFeatures:
@@ -295,7 +322,7 @@ class TestPlatformSpecificFeatures:
 
     def test_get_platform_name(self) -> None:
         """Verify platform name detection."""
-        system = platform.system()
+        system = _SYSTEM
         assert system in ["Linux", "Darwin", "Windows"]
 
         # Verify lowercase helper
@@ -303,24 +330,20 @@ class TestPlatformSpecificFeatures:
 
     def test_is_windows(self) -> None:
         """Verify Windows platform detection."""
-        is_windows = sys.platform.startswith("win")
+        is_windows = _IS_WINDOWS
         assert isinstance(is_windows, bool)
 
     def test_is_macos(self) -> None:
         """Verify macOS platform detection."""
-        is_macos = sys.platform == "darwin"
+        is_macos = _IS_MACOS
         assert isinstance(is_macos, bool)
 
     def test_is_linux(self) -> None:
         """Verify Linux platform detection."""
-        is_linux = sys.platform.startswith("linux")
+        is_linux = _IS_LINUX
         assert isinstance(is_linux, bool)
 
     def test_platform_one_is_true(self) -> None:
         """Verify exactly one platform is detected."""
-        is_windows = sys.platform.startswith("win")
-        is_macos = sys.platform == "darwin"
-        is_linux = sys.platform.startswith("linux")
-
         # Exactly one should be True
-        assert sum([is_windows, is_macos, is_linux]) == 1
+        assert sum([_IS_WINDOWS, _IS_MACOS, _IS_LINUX]) == 1
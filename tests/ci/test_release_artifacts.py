@@ -1,7 +1,11 @@
 """CI tests for release artifact validation."""
 
+import hashlib
 from pathlib import Path
-from unittest.mock import Mock, patch
+
+import pytest
+
+from kekkai_core.windows.scoop import generate_scoop_checksum_file
 
 
 class TestReleaseArtifacts:
@@ -29,7 +33,6 @@ class TestReleaseArtifacts:
 
     def test_release_includes_wheel_file(self, tmp_path: Path) -> None:
         """Verify release includes .whl file."""
-        # Simulate dist directory
         dist_dir = tmp_path / "dist"
         dist_dir.mkdir()
 
@@ -43,7 +46,6 @@ class TestReleaseArtifacts:
 
     def test_release_includes_source_distribution(self, tmp_path: Path) -> None:
         """Verify release includes source distribution."""
-        # Simulate dist directory
         dist_dir = tmp_path / "dist"
         dist_dir.mkdir()
 
@@ -58,15 +60,8 @@ class TestReleaseArtifacts:
 class TestGitHubReleaseValidation:
     """Test GitHub release validation."""
 
-    @patch("urllib.request.urlopen")
-    def test_github_release_artifact_accessible(self, mock_urlopen: Mock) -> None:
+    def test_github_release_artifact_accessible(self) -> None:
         """Verify GitHub release artifacts are accessible."""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status = 200
-        mock_response.read.return_value = b"wheel content"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-
         # Simulate checking release artifact
         version = "0.0.1"
         whl_url = f"https://github.com/kademoslabs/kekkai/releases/download/v{version}/kekkai-{version}-py3-none-any.whl"
@@ -97,33 +92,23 @@ class TestGitHubReleaseValidation:
         assert version in tag
 
 
-class TestWheelMetadata:
-    """Test wheel package metadata."""
-
-    def test_wheel_name_format(self) -> None:
-        """Verify wheel name follows PEP 427 format."""
-        wheel_name = "kekkai-0.0.1-py3-none-any.whl"
+WHEEL_NAME = "kekkai-0.0.1-py3-none-any.whl"
 
-        parts = wheel_name.split("-")
-        assert len(parts) == 5  # name-version-pyver-abi-platform.whl
-        assert parts[0] == "kekkai"
-        assert parts[1] == "0.0.1"
-        assert parts[2] == "py3"
-        assert parts[3] == "none"
-        assert parts[4] == "any.whl"
 
-    def test_wheel_supports_any_platform(self) -> None:
-        """Verify wheel is platform-independent."""
-        wheel_name = "kekkai-0.0.1-py3-none-any.whl"
+@pytest.fixture
+def wheel_parts() -> list[str]:
+    """Split the release wheel name into its PEP 427 fields."""
+    return WHEEL_NAME.split("-")
 
-        assert "any.whl" in wheel_name
-        assert "none" in wheel_name  # No ABI requirements
 
-    def test_wheel_requires_python3(self) -> None:
-        """Verify wheel specifies Python 3."""
-        wheel_name = "kekkai-0.0.1-py3-none-any.whl"
+class TestWheelMetadata:
+    """Test wheel package metadata."""
 
-        assert "py3" in wheel_name
+    def test_wheel_name_format(self, wheel_parts: list[str]) -> None:
+        """Verify wheel name is pure-Python, platform-independent PEP 427."""
+        # name-version-pyver-abi-platform.whl; "none"/"any" mean no ABI or
+        # platform requirements, "py3" means Python 3 only
+        assert wheel_parts == ["kekkai", "0.0.1", "py3", "none", "any.whl"]
 
 
 class TestSBOMGeneration:
@@ -161,24 +146,21 @@ class TestChecksumGeneration:
 
     def test_sha256_checksum_format(self) -> None:
         """Verify SHA256 checksum format."""
-        import hashlib
-
         content = b"test wheel content"
-        sha256 = hashlib.sha256(content).hexdigest()
+        sha256 = hashlib.sha256(content, usedforsecurity=False).hexdigest()
 
         assert len(sha256) == 64
         assert all(c in "0123456789abcdef" for c in sha256)
 
     def test_checksum_for_wheel_file(self, tmp_path: Path) -> None:
         """Verify checksum can be calculated for wheel file."""
-        import hashlib
-
         wheel_file = tmp_path / "kekkai-0.0.1-py3-none-any.whl"
         content = b"wheel content"
         wheel_file.write_bytes(content)
 
         # Calculate checksum
-        sha256 = hashlib.sha256(content).hexdigest()
+        with wheel_file.open("rb") as f:
+            sha256 = hashlib.file_digest(f, "sha256").hexdigest()
 
         # Verify format
         assert len(sha256) == 64
@@ -186,8 +168,6 @@ class TestChecksumGeneration:
 
     def test_checksum_file_generation(self, tmp_path: Path) -> None:
         """Verify checksum file can be generated."""
-        from kekkai_core.windows.scoop import generate_scoop_checksum_file
-
         checksum_content = generate_scoop_checksum_file(
             version="0.0.1",
             sha256="a" * 64,
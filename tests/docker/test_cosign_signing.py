@@ -1,5 +1,9 @@
 """Unit tests for Cosign image signing and verification."""
 
+import re
+import subprocess
+from collections.abc import Callable, Iterator
+from itertools import pairwise
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -13,142 +17,137 @@ from kekkai_core.docker.signing import (
     verify_signature,
 )
 
+_TIMED_OUT = re.compile("timed out")
+
+# Canned subprocess.run results; tests only read these.
+_SUCCESS = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+_VERIFY_FAILED = subprocess.CompletedProcess([], 1, stdout="", stderr="verification failed")
+
+
+@pytest.fixture(scope="module")
+def _subprocess_run() -> Iterator[MagicMock]:
+    """Patch subprocess.run once for the whole module."""
+    with patch("kekkai_core.docker.signing.subprocess.run") as run:
+        yield run
+
+
+@pytest.fixture(autouse=True)
+def mock_run(_subprocess_run: MagicMock) -> MagicMock:
+    """Give each test a clean view of the module-wide subprocess.run mock."""
+    _subprocess_run.reset_mock(return_value=True, side_effect=True)
+    return _subprocess_run
+
+
+@pytest.fixture(scope="module")
+def key_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write the fake key files once; tests only pass their paths to Cosign."""
+    key_dir = tmp_path_factory.mktemp("keys")
+    contents = {
+        "cosign.key": "fake-private-key",
+        "cosign.pub": "fake-public-key",
+        "cosign-new.key": "new-private-key",
+        "cosign-old.pub": "old-public-key",
+    }
+    for name, content in contents.items():
+        (key_dir / name).write_text(content)
+    return {name: key_dir / name for name in contents}
+
+
+def _fake_keygen(*args: object, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+    """Stand in for `cosign generate-key-pair` by creating empty keys in cwd."""
+    key_dir = Path(str(kwargs["cwd"]))
+    (key_dir / "cosign.key").write_bytes(b"")
+    (key_dir / "cosign.pub").write_bytes(b"")
+    return _SUCCESS
+
 
 class TestImageSigning:
     """Test Docker image signing with Cosign."""
 
-    @patch("subprocess.run")
     def test_sign_image_success(self, mock_run: MagicMock) -> None:
         """Verify image signing succeeds."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = sign_image("test-image:latest")
 
         assert result is True
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert "cosign" in args
         assert "sign" in args
         assert "--yes" in args
         assert "test-image:latest" in args
 
-    @patch("subprocess.run")
-    def test_sign_image_with_key(self, mock_run: MagicMock, tmp_path: Path) -> None:
+    def test_sign_image_with_key(self, mock_run: MagicMock, key_files: dict[str, Path]) -> None:
         """Verify signing with private key."""
-        key_path = tmp_path / "cosign.key"
-        key_path.write_text("fake-private-key")
+        key_path = key_files["cosign.key"]
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = sign_image("test-image:latest", key_path=key_path)
 
         assert result is True
-        args = mock_run.call_args[0][0]
-        assert "--key" in args
-        key_index = args.index("--key")
-        assert args[key_index + 1] == str(key_path)
+        args = mock_run.call_args.args[0]
+        assert ("--key", str(key_path)) in pairwise(args)
 
-    @patch("subprocess.run")
     def test_sign_image_with_password(self, mock_run: MagicMock) -> None:
         """Verify signing with password-protected key."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         sign_image("test-image:latest", password="test-password")
 
         # Verify COSIGN_PASSWORD env var passed
-        call_kwargs = mock_run.call_args[1]
+        call_kwargs = mock_run.call_args.kwargs
         assert call_kwargs["env"] is not None
 
-    @patch("subprocess.run")
-    def test_sign_image_failure_raises_error(self, mock_run: MagicMock) -> None:
-        """Verify signing failures raise CosignError."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "cosign", stderr="signing failed")
-
-        with pytest.raises(CosignError, match="Image signing failed"):
-            sign_image("test-image:latest")
-
-    @patch("subprocess.run")
-    def test_sign_image_timeout_handled(self, mock_run: MagicMock) -> None:
-        """Verify timeout errors are handled."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("cosign", 120)
-
-        with pytest.raises(CosignError, match="timed out"):
-            sign_image("test-image:latest")
-
 
 class TestSignatureVerification:
     """Test Docker image signature verification."""
 
-    @patch("subprocess.run")
     def test_verify_signature_valid(self, mock_run: MagicMock) -> None:
         """Verify signature verification succeeds for valid signature."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = verify_signature("test-image:latest")
 
         assert result is True
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert "cosign" in args
         assert "verify" in args
         assert "test-image:latest" in args
 
-    @patch("subprocess.run")
-    def test_verify_signature_with_key(self, mock_run: MagicMock, tmp_path: Path) -> None:
+    def test_verify_signature_with_key(
+        self, mock_run: MagicMock, key_files: dict[str, Path]
+    ) -> None:
         """Verify signature verification with public key."""
-        pub_key = tmp_path / "cosign.pub"
-        pub_key.write_text("fake-public-key")
+        pub_key = key_files["cosign.pub"]
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = verify_signature("test-image:latest", key_path=pub_key)
 
         assert result is True
-        args = mock_run.call_args[0][0]
-        assert "--key" in args
-        key_index = args.index("--key")
-        assert args[key_index + 1] == str(pub_key)
+        args = mock_run.call_args.args[0]
+        assert ("--key", str(pub_key)) in pairwise(args)
 
-    @patch("subprocess.run")
     def test_verify_signature_invalid(self, mock_run: MagicMock) -> None:
         """Verify signature verification fails for invalid signature."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="verification failed")
+        mock_run.return_value = _VERIFY_FAILED
 
         result = verify_signature("test-image:latest")
 
         assert result is False
 
-    @patch("subprocess.run")
-    def test_verify_signature_timeout_raises_error(self, mock_run: MagicMock) -> None:
-        """Verify timeout during verification raises error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("cosign", 120)
-
-        with pytest.raises(CosignError, match="timed out"):
-            verify_signature("test-image:latest")
-
 
 class TestKeyGeneration:
     """Test Cosign keypair generation."""
 
-    @patch("subprocess.run")
     def test_generate_keypair_success(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Verify keypair generation succeeds."""
         output_dir = tmp_path / "keys"
 
-        # Mock key file creation
-        def create_keys(*args: object, **kwargs: object) -> MagicMock:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            (output_dir / "cosign.key").write_text("private-key")
-            (output_dir / "cosign.pub").write_text("public-key")
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        mock_run.side_effect = create_keys
+        mock_run.side_effect = _fake_keygen
 
         private_key, public_key = generate_keypair(output_dir)
 
@@ -157,21 +156,11 @@ class TestKeyGeneration:
         assert private_key.name == "cosign.key"
         assert public_key.name == "cosign.pub"
 
-    @patch("subprocess.run")
     def test_generate_keypair_creates_directory(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Verify keypair generation creates output directory."""
         output_dir = tmp_path / "nonexistent" / "keys"
 
-        def create_keys(*args: object, **kwargs: Any) -> MagicMock:
-            cwd = kwargs.get("cwd")
-            if cwd:
-                cwd_path = Path(str(cwd))
-                cwd_path.mkdir(parents=True, exist_ok=True)
-                (cwd_path / "cosign.key").write_text("private")
-                (cwd_path / "cosign.pub").write_text("public")
-            return MagicMock(returncode=0, stdout="", stderr="")
-
-        mock_run.side_effect = create_keys
+        mock_run.side_effect = _fake_keygen
 
         private_key, public_key = generate_keypair(output_dir)
 
@@ -179,70 +168,90 @@ class TestKeyGeneration:
         assert private_key.exists()
         assert public_key.exists()
 
-    @patch("subprocess.run")
-    def test_generate_keypair_failure_raises_error(
-        self, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Verify keypair generation failures raise error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "cosign", stderr="key generation failed"
-        )
-
-        with pytest.raises(CosignError, match="Key generation failed"):
-            generate_keypair(tmp_path)
-
-    @patch("subprocess.run")
     def test_generate_keypair_missing_keys_raises_error(
         self, mock_run: MagicMock, tmp_path: Path
     ) -> None:
         """Verify error if keys not created after generation."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         # Keys not created, should raise error
         with pytest.raises(CosignError, match="keys not found"):
             generate_keypair(tmp_path)
 
-    @patch("subprocess.run")
-    def test_generate_keypair_timeout_handled(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Verify timeout during key generation is handled."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("cosign", 60)
-
-        with pytest.raises(CosignError, match="timed out"):
-            generate_keypair(tmp_path)
-
 
 class TestKeyRotation:
     """Test key rotation scenarios."""
 
-    @patch("subprocess.run")
-    def test_sign_with_new_key_after_rotation(self, mock_run: MagicMock, tmp_path: Path) -> None:
+    def test_sign_with_new_key_after_rotation(
+        self, mock_run: MagicMock, key_files: dict[str, Path]
+    ) -> None:
         """Verify signing works with newly rotated key."""
-        new_key = tmp_path / "cosign-new.key"
-        new_key.write_text("new-private-key")
+        new_key = key_files["cosign-new.key"]
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = sign_image("test-image:latest", key_path=new_key)
 
         assert result is True
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert str(new_key) in args
 
-    @patch("subprocess.run")
     def test_verify_with_old_key_fails_after_rotation(
-        self, mock_run: MagicMock, tmp_path: Path
+        self, mock_run: MagicMock, key_files: dict[str, Path]
     ) -> None:
         """Verify old key fails verification after rotation."""
-        old_pub_key = tmp_path / "cosign-old.pub"
-        old_pub_key.write_text("old-public-key")
+        old_pub_key = key_files["cosign-old.pub"]
 
         # Simulate verification failure with old key
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="verification failed")
+        mock_run.return_value = _VERIFY_FAILED
 
         result = verify_signature("test-image:latest", key_path=old_pub_key)
 
         assert result is False
+
+
+class TestCosignSubprocessErrors:
+    """Test Cosign subprocess failures surface as CosignError."""
+
+    @pytest.mark.parametrize(
+        ("call", "match"),
+        [
+            (lambda _: sign_image("test-image:latest"), "Image signing failed"),
+            (generate_keypair, "Key generation failed"),
+        ],
+        ids=["sign_image", "generate_keypair"],
+    )
+    def test_failure_raises_error(
+        self,
+        mock_run: MagicMock,
+        tmp_path: Path,
+        call: Callable[[Path], object],
+        match: str,
+    ) -> None:
+        """Verify non-zero Cosign exits raise CosignError."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "cosign", stderr="cosign failed")
+
+        with pytest.raises(CosignError, match=match):
+            call(tmp_path)
+
+    @pytest.mark.parametrize(
+        ("call", "timeout"),
+        [
+            (lambda _: sign_image("test-image:latest"), 120),
+            (lambda _: verify_signature("test-image:latest"), 120),
+            (generate_keypair, 60),
+        ],
+        ids=["sign_image", "verify_signature", "generate_keypair"],
+    )
+    def test_timeout_raises_error(
+        self,
+        mock_run: MagicMock,
+        tmp_path: Path,
+        call: Callable[[Path], object],
+        timeout: int,
+    ) -> None:
+        """Verify Cosign timeouts raise CosignError."""
+        mock_run.side_effect = subprocess.TimeoutExpired("cosign", timeout)
+
+        with pytest.raises(CosignError, match=_TIMED_OUT):
+            call(tmp_path)
@@ -1,6 +1,9 @@
 """Unit tests for Docker image metadata extraction."""
 
 import json
+import re
+import subprocess
+from collections.abc import Callable, Iterator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -15,65 +18,71 @@ from kekkai_core.docker.metadata import (
     verify_multi_arch_support,
 )
 
+_TIMED_OUT = re.compile("timed out")
+_PARSE_FAILED = re.compile("Failed to parse")
+
+_METADATA = {
+    "Id": "sha256:abc123",
+    "Config": {"Labels": {"app": "kekkai"}},
+}
+_MANIFEST = {
+    "manifests": [
+        {"platform": {"architecture": "amd64"}},
+        {"platform": {"architecture": "arm64"}},
+    ]
+}
+
+# Canned subprocess.run results; tests only read these.
+_INSPECT_OUTPUT = subprocess.CompletedProcess([], 0, stdout=json.dumps([_METADATA]), stderr="")
+_MANIFEST_OUTPUT = subprocess.CompletedProcess([], 0, stdout=json.dumps(_MANIFEST), stderr="")
+_INVALID_JSON = subprocess.CompletedProcess([], 0, stdout="invalid json", stderr="")
+_EMPTY_LIST = subprocess.CompletedProcess([], 0, stdout="[]", stderr="")
+
+
+@pytest.fixture(scope="module")
+def _subprocess_run() -> Iterator[MagicMock]:
+    """Patch subprocess.run once for the whole module."""
+    with patch("kekkai_core.docker.metadata.subprocess.run") as run:
+        yield run
+
+
+@pytest.fixture(autouse=True)
+def mock_run(_subprocess_run: MagicMock) -> MagicMock:
+    """Give each test a clean view of the module-wide subprocess.run mock."""
+    _subprocess_run.reset_mock(return_value=True, side_effect=True)
+    return _subprocess_run
+
 
 class TestMetadataExtraction:
     """Test Docker image metadata extraction."""
 
-    @patch("subprocess.run")
     def test_extract_image_metadata_success(self, mock_run: MagicMock) -> None:
         """Verify metadata extraction returns image config."""
-        metadata = {
-            "Id": "sha256:abc123",
-            "Config": {"Labels": {"app": "kekkai"}},
-        }
-
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps([metadata]), stderr="")
+        mock_run.return_value = _INSPECT_OUTPUT
 
         result = extract_image_metadata("test-image:latest")
 
-        assert result == metadata
+        assert result == _METADATA
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
         assert "docker" in args
         assert "inspect" in args
         assert "test-image:latest" in args
 
-    @patch("subprocess.run")
-    def test_extract_metadata_failure_raises_error(self, mock_run: MagicMock) -> None:
-        """Verify extraction failures raise error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "docker", stderr="image not found")
-
-        with pytest.raises(DockerMetadataError, match="Failed to extract metadata"):
-            extract_image_metadata("nonexistent:latest")
-
-    @patch("subprocess.run")
     def test_extract_metadata_invalid_json(self, mock_run: MagicMock) -> None:
         """Verify invalid JSON raises error."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="invalid json", stderr="")
+        mock_run.return_value = _INVALID_JSON
 
-        with pytest.raises(DockerMetadataError, match="Failed to parse"):
+        with pytest.raises(DockerMetadataError, match=_PARSE_FAILED):
             extract_image_metadata("test-image:latest")
 
-    @patch("subprocess.run")
     def test_extract_metadata_empty_response(self, mock_run: MagicMock) -> None:
         """Verify empty response raises error."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+        mock_run.return_value = _EMPTY_LIST
 
         with pytest.raises(DockerMetadataError, match="Invalid metadata format"):
             extract_image_metadata("test-image:latest")
 
-    @patch("subprocess.run")
-    def test_extract_metadata_timeout_handled(self, mock_run: MagicMock) -> None:
-        """Verify timeout errors are handled."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("docker", 30)
-
-        with pytest.raises(DockerMetadataError, match="timed out"):
-            extract_image_metadata("test-image:latest")
-
 
 class TestOCILabels:
     """Test OCI label extraction."""
@@ -126,57 +135,26 @@ class TestOCILabels:
 class TestManifestParsing:
     """Test Docker manifest parsing."""
 
-    @patch("subprocess.run")
     def test_parse_manifest_success(self, mock_run: MagicMock) -> None:
         """Verify manifest parsing succeeds."""
-        manifest = {
-            "manifests": [
-                {"platform": {"architecture": "amd64"}},
-                {"platform": {"architecture": "arm64"}},
-            ]
-        }
-
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(manifest), stderr="")
+        mock_run.return_value = _MANIFEST_OUTPUT
 
         result = parse_manifest("test-image:latest")
 
-        assert result == manifest
+        assert result == _MANIFEST
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
         assert "docker" in args
         assert "manifest" in args
         assert "inspect" in args
 
-    @patch("subprocess.run")
-    def test_parse_manifest_failure_raises_error(self, mock_run: MagicMock) -> None:
-        """Verify manifest parsing failures raise error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "docker", stderr="manifest not found"
-        )
-
-        with pytest.raises(DockerMetadataError, match="Failed to parse manifest"):
-            parse_manifest("nonexistent:latest")
-
-    @patch("subprocess.run")
     def test_parse_manifest_invalid_json(self, mock_run: MagicMock) -> None:
         """Verify invalid JSON raises error."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="invalid json", stderr="")
+        mock_run.return_value = _INVALID_JSON
 
         with pytest.raises(DockerMetadataError, match="Failed to parse manifest JSON"):
             parse_manifest("test-image:latest")
 
-    @patch("subprocess.run")
-    def test_parse_manifest_timeout_handled(self, mock_run: MagicMock) -> None:
-        """Verify timeout errors are handled."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("docker", 30)
-
-        with pytest.raises(DockerMetadataError, match="timed out"):
-            parse_manifest("test-image:latest")
-
 
 class TestArchitectureSupport:
     """Test architecture detection and validation."""
@@ -269,3 +247,36 @@ class TestArchitectureSupport:
         result = verify_multi_arch_support(manifest, [])
 
         assert result is True
+
+
+class TestDockerSubprocessErrors:
+    """Test Docker CLI failures surface as DockerMetadataError."""
+
+    @pytest.mark.parametrize(
+        ("call", "match"),
+        [
+            (extract_image_metadata, "Failed to extract metadata"),
+            (parse_manifest, "Failed to parse manifest"),
+        ],
+        ids=["extract_image_metadata", "parse_manifest"],
+    )
+    def test_failure_raises_error(
+        self, mock_run: MagicMock, call: Callable[[str], object], match: str
+    ) -> None:
+        """Verify non-zero Docker exits raise DockerMetadataError."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "docker", stderr="not found")
+
+        with pytest.raises(DockerMetadataError, match=match):
+            call("nonexistent:latest")
+
+    @pytest.mark.parametrize(
+        "call",
+        [extract_image_metadata, parse_manifest],
+        ids=["extract_image_metadata", "parse_manifest"],
+    )
+    def test_timeout_raises_error(self, mock_run: MagicMock, call: Callable[[str], object]) -> None:
+        """Verify Docker CLI timeouts raise DockerMetadataError."""
+        mock_run.side_effect = subprocess.TimeoutExpired("docker", 30)
+
+        with pytest.raises(DockerMetadataError, match=_TIMED_OUT):
+            call("test-image:latest")
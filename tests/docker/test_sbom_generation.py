@@ -1,6 +1,10 @@
 """Unit tests for SBOM generation."""
 
 import json
+import re
+import subprocess
+from collections.abc import Callable, Iterator
+from itertools import pairwise
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -9,112 +13,120 @@ import pytest
 
 from kekkai_core.docker.sbom import (
     SBOMError,
+    SBOMFormat,
     attach_sbom_to_image,
     extract_dependencies,
     generate_sbom,
     validate_sbom_format,
 )
 
+_TIMED_OUT = re.compile("timed out")
+_PARSE_FAILED = re.compile("Failed to parse")
+
+_SPDX_SBOM = {
+    "spdxVersion": "SPDX-2.3",
+    "dataLicense": "CC0-1.0",
+    "name": "kekkai",
+    "documentNamespace": "https://example.com",
+    "packages": [],
+}
+_CYCLONEDX_SBOM = {
+    "bomFormat": "CycloneDX",
+    "specVersion": "1.4",
+    "version": 1,
+    "components": [],
+}
+
+# Canned subprocess.run results; tests only read these.
+_SPDX_OUTPUT = subprocess.CompletedProcess([], 0, stdout=json.dumps(_SPDX_SBOM), stderr="")
+_CYCLONEDX_OUTPUT = subprocess.CompletedProcess(
+    [], 0, stdout=json.dumps(_CYCLONEDX_SBOM), stderr=""
+)
+_SUCCESS = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+_EMPTY_OBJECT = subprocess.CompletedProcess([], 0, stdout="{}", stderr="")
+_INVALID_JSON = subprocess.CompletedProcess([], 0, stdout="invalid json", stderr="")
 
-class TestSBOMGeneration:
-    """Test SBOM generation with Trivy."""
 
-    @patch("subprocess.run")
-    def test_generate_sbom_spdx_json(self, mock_run: MagicMock) -> None:
-        """Verify SBOM generation in SPDX JSON format."""
-        sbom_data = {
-            "spdxVersion": "SPDX-2.3",
-            "dataLicense": "CC0-1.0",
-            "name": "kekkai",
-            "documentNamespace": "https://example.com",
-            "packages": [],
-        }
+@pytest.fixture(scope="module")
+def _subprocess_run() -> Iterator[MagicMock]:
+    """Patch subprocess.run once for the whole module."""
+    with patch("kekkai_core.docker.sbom.subprocess.run") as run:
+        yield run
 
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sbom_data), stderr="")
 
-        result = generate_sbom("test-image:latest", output_format="spdx-json")
+@pytest.fixture(autouse=True)
+def mock_run(_subprocess_run: MagicMock) -> MagicMock:
+    """Give each test a clean view of the module-wide subprocess.run mock."""
+    _subprocess_run.reset_mock(return_value=True, side_effect=True)
+    return _subprocess_run
 
-        assert result == sbom_data
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert "trivy" in args
-        assert "image" in args
-        assert "--format" in args
-        assert "spdx-json" in args
 
-    @patch("subprocess.run")
-    def test_generate_sbom_cyclonedx_json(self, mock_run: MagicMock) -> None:
-        """Verify SBOM generation in CycloneDX JSON format."""
-        sbom_data = {
-            "bomFormat": "CycloneDX",
-            "specVersion": "1.4",
-            "version": 1,
-            "components": [],
-        }
+@pytest.fixture(scope="module")
+def sbom_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the SBOM to attach once; attachment never modifies it."""
+    path = tmp_path_factory.mktemp("sbom") / "sbom.spdx.json"
+    path.write_text('{"spdxVersion": "SPDX-2.3"}')
+    return path
 
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sbom_data), stderr="")
 
-        result = generate_sbom("test-image:latest", output_format="cyclonedx-json")
+class TestSBOMGeneration:
+    """Test SBOM generation with Trivy."""
 
-        assert result == sbom_data
-        args = mock_run.call_args[0][0]
-        assert "cyclonedx-json" in args
+    @pytest.mark.parametrize(
+        ("output_format", "output", "sbom"),
+        [
+            ("spdx-json", _SPDX_OUTPUT, _SPDX_SBOM),
+            ("cyclonedx-json", _CYCLONEDX_OUTPUT, _CYCLONEDX_SBOM),
+        ],
+    )
+    def test_generate_sbom_format(
+        self,
+        mock_run: MagicMock,
+        output_format: SBOMFormat,
+        output: subprocess.CompletedProcess[str],
+        sbom: dict[str, Any],
+    ) -> None:
+        """Verify SBOM generation in each supported JSON format."""
+        mock_run.return_value = output
+
+        result = generate_sbom("test-image:latest", output_format=output_format)
+
+        assert result == sbom
+        mock_run.assert_called_once()
+        args = mock_run.call_args.args[0]
+        assert "trivy" in args
+        assert "image" in args
+        assert "--format" in args
+        assert output_format in args
 
-    @patch("subprocess.run")
     def test_generate_sbom_with_output_file(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Verify SBOM can be written to file."""
         output_file = tmp_path / "sbom.spdx.json"
-        mock_run.return_value = MagicMock(returncode=0, stdout="{}", stderr="")
+        mock_run.return_value = _EMPTY_OBJECT
 
         generate_sbom("test-image:latest", output_file=output_file)
 
-        args = mock_run.call_args[0][0]
-        assert "--output" in args
-        output_index = args.index("--output")
-        assert args[output_index + 1] == str(output_file)
-
-    @patch("subprocess.run")
-    def test_generate_sbom_failure_raises_error(self, mock_run: MagicMock) -> None:
-        """Verify SBOM generation failures raise error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "trivy", stderr="generation failed")
-
-        with pytest.raises(SBOMError, match="SBOM generation failed"):
-            generate_sbom("test-image:latest")
-
-    @patch("subprocess.run")
-    def test_generate_sbom_timeout_handled(self, mock_run: MagicMock) -> None:
-        """Verify timeout errors are handled."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("trivy", 300)
+        args = mock_run.call_args.args[0]
+        assert ("--output", str(output_file)) in pairwise(args)
 
-        with pytest.raises(SBOMError, match="timed out"):
-            generate_sbom("test-image:latest")
-
-    @patch("subprocess.run")
     def test_generate_sbom_invalid_json_raises_error(self, mock_run: MagicMock) -> None:
         """Verify invalid JSON output raises error."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="invalid json", stderr="")
+        mock_run.return_value = _INVALID_JSON
 
-        with pytest.raises(SBOMError, match="Failed to parse"):
+        with pytest.raises(SBOMError, match=_PARSE_FAILED):
             generate_sbom("test-image:latest", output_format="spdx-json")
 
 
 class TestSBOMValidation:
     """Test SBOM format validation."""
 
-    def test_validate_spdx_format_valid(self) -> None:
-        """Verify valid SPDX SBOM passes validation."""
-        sbom_data = {
-            "spdxVersion": "SPDX-2.3",
-            "dataLicense": "CC0-1.0",
-            "name": "kekkai",
-            "documentNamespace": "https://example.com",
-        }
-
-        assert validate_sbom_format(sbom_data, "spdx-json") is True
+    @pytest.mark.parametrize(
+        ("output_format", "sbom"),
+        [("spdx-json", _SPDX_SBOM), ("cyclonedx-json", _CYCLONEDX_SBOM)],
+    )
+    def test_validate_format_valid(self, output_format: SBOMFormat, sbom: dict[str, Any]) -> None:
+        """Verify a complete SBOM passes validation for its format."""
+        assert validate_sbom_format(sbom, output_format) is True
 
     def test_validate_spdx_format_missing_fields(self) -> None:
         """Verify SPDX validation fails with missing fields."""
@@ -122,16 +134,6 @@ class TestSBOMValidation:
 
         assert validate_sbom_format(sbom_data, "spdx-json") is False
 
-    def test_validate_cyclonedx_format_valid(self) -> None:
-        """Verify valid CycloneDX SBOM passes validation."""
-        sbom_data = {
-            "bomFormat": "CycloneDX",
-            "specVersion": "1.4",
-            "version": 1,
-        }
-
-        assert validate_sbom_format(sbom_data, "cyclonedx-json") is True
-
     def test_validate_cyclonedx_format_missing_fields(self) -> None:
         """Verify CycloneDX validation fails with missing fields."""
         sbom_data = {"bomFormat": "CycloneDX"}
@@ -146,37 +148,22 @@ class TestSBOMValidation:
 class TestDependencyExtraction:
     """Test dependency extraction from SBOM."""
 
-    def test_extract_dependencies_spdx(self) -> None:
-        """Verify dependency extraction from SPDX SBOM."""
-        sbom_data: dict[str, Any] = {
-            "packages": [
-                {"name": "python", "version": "3.12"},
-                {"name": "pytest", "version": "7.4.0"},
-                {"name": "mypy", "version": "1.5.0"},
-            ]
-        }
+    @pytest.mark.parametrize(
+        ("output_format", "key", "names"),
+        [
+            ("spdx-json", "packages", ["python", "pytest", "mypy"]),
+            ("cyclonedx-json", "components", ["python", "requests"]),
+        ],
+    )
+    def test_extract_dependencies(
+        self, output_format: SBOMFormat, key: str, names: list[str]
+    ) -> None:
+        """Verify dependency extraction from each SBOM format."""
+        sbom_data = {key: [{"name": name, "version": "1.0.0"} for name in names]}
 
-        deps = extract_dependencies(sbom_data, "spdx-json")
+        deps = extract_dependencies(sbom_data, output_format)
 
-        assert len(deps) == 3
-        assert "python" in deps
-        assert "pytest" in deps
-        assert "mypy" in deps
-
-    def test_extract_dependencies_cyclonedx(self) -> None:
-        """Verify dependency extraction from CycloneDX SBOM."""
-        sbom_data: dict[str, Any] = {
-            "components": [
-                {"name": "python", "version": "3.12"},
-                {"name": "requests", "version": "2.31.0"},
-            ]
-        }
-
-        deps = extract_dependencies(sbom_data, "cyclonedx-json")
-
-        assert len(deps) == 2
-        assert "python" in deps
-        assert "requests" in deps
+        assert deps == names
 
     def test_extract_dependencies_empty_sbom(self) -> None:
         """Verify extraction handles empty SBOM."""
@@ -199,19 +186,15 @@ class TestDependencyExtraction:
 class TestSBOMAttachment:
     """Test SBOM attachment to Docker images."""
 
-    @patch("subprocess.run")
-    def test_attach_sbom_success(self, mock_run: MagicMock, tmp_path: Path) -> None:
+    def test_attach_sbom_success(self, mock_run: MagicMock, sbom_file: Path) -> None:
         """Verify SBOM can be attached to image."""
-        sbom_file = tmp_path / "sbom.spdx.json"
-        sbom_file.write_text('{"spdxVersion": "SPDX-2.3"}')
-
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = _SUCCESS
 
         result = attach_sbom_to_image("test-image:latest", sbom_file)
 
         assert result is True
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert "cosign" in args
         assert "attach" in args
         assert "sbom" in args
@@ -225,30 +208,51 @@ class TestSBOMAttachment:
         with pytest.raises(SBOMError, match="SBOM file not found"):
             attach_sbom_to_image("test-image:latest", sbom_file)
 
-    @patch("subprocess.run")
-    def test_attach_sbom_failure_raises_error(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Verify attachment failures raise error."""
-        import subprocess
 
-        sbom_file = tmp_path / "sbom.spdx.json"
-        sbom_file.write_text("{}")
-
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, "cosign", stderr="attachment failed"
-        )
-
-        with pytest.raises(SBOMError, match="SBOM attachment failed"):
-            attach_sbom_to_image("test-image:latest", sbom_file)
-
-    @patch("subprocess.run")
-    def test_attach_sbom_timeout_handled(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Verify timeout during attachment is handled."""
-        import subprocess
-
-        sbom_file = tmp_path / "sbom.spdx.json"
-        sbom_file.write_text("{}")
-
-        mock_run.side_effect = subprocess.TimeoutExpired("cosign", 120)
-
-        with pytest.raises(SBOMError, match="timed out"):
-            attach_sbom_to_image("test-image:latest", sbom_file)
+class TestSBOMSubprocessErrors:
+    """Test Trivy and Cosign failures surface as SBOMError."""
+
+    @pytest.mark.parametrize(
+        ("call", "match"),
+        [
+            (lambda _: generate_sbom("test-image:latest"), "SBOM generation failed"),
+            (
+                lambda sbom: attach_sbom_to_image("test-image:latest", sbom),
+                "SBOM attachment failed",
+            ),
+        ],
+        ids=["generate_sbom", "attach_sbom_to_image"],
+    )
+    def test_failure_raises_error(
+        self,
+        mock_run: MagicMock,
+        sbom_file: Path,
+        call: Callable[[Path], object],
+        match: str,
+    ) -> None:
+        """Verify non-zero tool exits raise SBOMError."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "tool", stderr="tool failed")
+
+        with pytest.raises(SBOMError, match=match):
+            call(sbom_file)
+
+    @pytest.mark.parametrize(
+        ("call", "timeout"),
+        [
+            (lambda _: generate_sbom("test-image:latest"), 300),
+            (lambda sbom: attach_sbom_to_image("test-image:latest", sbom), 120),
+        ],
+        ids=["generate_sbom", "attach_sbom_to_image"],
+    )
+    def test_timeout_raises_error(
+        self,
+        mock_run: MagicMock,
+        sbom_file: Path,
+        call: Callable[[Path], object],
+        timeout: int,
+    ) -> None:
+        """Verify tool timeouts raise SBOMError."""
+        mock_run.side_effect = subprocess.TimeoutExpired("tool", timeout)
+
+        with pytest.raises(SBOMError, match=_TIMED_OUT):
+            call(sbom_file)
@@ -1,6 +1,10 @@
 """Unit tests for Trivy security scanning."""
 
 import json
+import re
+import subprocess
+from collections.abc import Iterator
+from itertools import pairwise
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -15,80 +19,92 @@ from kekkai_core.docker.security import (
     run_trivy_scan,
 )
 
+_TIMED_OUT = re.compile("timed out")
+_PARSE_FAILED = re.compile("Failed to parse")
+
+_SCAN_RESULTS = {
+    "Results": [{"Vulnerabilities": [{"VulnerabilityID": "CVE-2023-1234", "Severity": "HIGH"}]}]
+}
+_SARIF_RESULTS = {"version": "2.1.0", "runs": []}
+
+# Canned subprocess.run results; tests only read these.
+_SCAN_OUTPUT = subprocess.CompletedProcess([], 0, stdout=json.dumps(_SCAN_RESULTS), stderr="")
+_SARIF_OUTPUT = subprocess.CompletedProcess([], 0, stdout=json.dumps(_SARIF_RESULTS), stderr="")
+_TABLE_OUTPUT = subprocess.CompletedProcess(
+    [], 0, stdout="CVE-2023-1234  HIGH  vulnerability description", stderr=""
+)
+_EMPTY_OBJECT = subprocess.CompletedProcess([], 0, stdout="{}", stderr="")
+_INVALID_JSON = subprocess.CompletedProcess([], 0, stdout="invalid json", stderr="")
+
+
+@pytest.fixture(scope="module")
+def _subprocess_run() -> Iterator[MagicMock]:
+    """Patch subprocess.run once for the whole module."""
+    with patch("kekkai_core.docker.security.subprocess.run") as run:
+        yield run
+
+
+@pytest.fixture(autouse=True)
+def mock_run(_subprocess_run: MagicMock) -> MagicMock:
+    """Give each test a clean view of the module-wide subprocess.run mock."""
+    _subprocess_run.reset_mock(return_value=True, side_effect=True)
+    return _subprocess_run
+
 
 class TestTrivyScanning:
     """Test Trivy scan execution and result parsing."""
 
-    @patch("subprocess.run")
     def test_trivy_scan_json_format(self, mock_run: MagicMock) -> None:
         """Verify Trivy scan returns JSON results."""
-        scan_results = {
-            "Results": [
-                {"Vulnerabilities": [{"VulnerabilityID": "CVE-2023-1234", "Severity": "HIGH"}]}
-            ]
-        }
-
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(scan_results), stderr="")
+        mock_run.return_value = _SCAN_OUTPUT
 
         result = run_trivy_scan("test-image:latest", output_format="json")
 
-        assert result == scan_results
+        assert result == _SCAN_RESULTS
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert "trivy" in args
         assert "image" in args
         assert "--format" in args
         assert "json" in args
 
-    @patch("subprocess.run")
     def test_trivy_scan_sarif_format(self, mock_run: MagicMock) -> None:
         """Verify Trivy can output SARIF format."""
-        sarif_results = {"version": "2.1.0", "runs": []}
-
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sarif_results), stderr="")
+        mock_run.return_value = _SARIF_OUTPUT
 
         result = run_trivy_scan("test-image:latest", output_format="sarif")
 
-        assert result == sarif_results
-        args = mock_run.call_args[0][0]
+        assert result == _SARIF_RESULTS
+        args = mock_run.call_args.args[0]
         assert "sarif" in args
 
-    @patch("subprocess.run")
     def test_trivy_scan_with_severity_filter(self, mock_run: MagicMock) -> None:
         """Verify severity filtering in scan command."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="{}", stderr="")
+        mock_run.return_value = _EMPTY_OBJECT
 
         run_trivy_scan("test-image:latest", severity=["CRITICAL", "HIGH"])
 
-        args = mock_run.call_args[0][0]
-        assert "--severity" in args
-        severity_index = args.index("--severity")
-        assert args[severity_index + 1] == "CRITICAL,HIGH"
+        args = mock_run.call_args.args[0]
+        assert ("--severity", "CRITICAL,HIGH") in pairwise(args)
 
-    @patch("subprocess.run")
     def test_trivy_scan_with_output_file(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Verify scan results can be written to file."""
         output_file = tmp_path / "scan-results.json"
-        mock_run.return_value = MagicMock(returncode=0, stdout="{}", stderr="")
+        mock_run.return_value = _EMPTY_OBJECT
 
         run_trivy_scan("test-image:latest", output_file=output_file)
 
-        args = mock_run.call_args[0][0]
-        assert "--output" in args
-        output_index = args.index("--output")
-        assert args[output_index + 1] == str(output_file)
+        args = mock_run.call_args.args[0]
+        assert ("--output", str(output_file)) in pairwise(args)
 
-    @patch("subprocess.run")
     def test_trivy_scan_table_format(self, mock_run: MagicMock) -> None:
         """Verify table format output."""
-        table_output = "CVE-2023-1234  HIGH  vulnerability description"
-        mock_run.return_value = MagicMock(returncode=0, stdout=table_output, stderr="")
+        mock_run.return_value = _TABLE_OUTPUT
 
         result = run_trivy_scan("test-image:latest", output_format="table")
 
-        assert result["output"] == table_output
+        assert result["output"] == _TABLE_OUTPUT.stdout
 
-    @patch("subprocess.run")
     def test_trivy_scan_failure_raises_error(self, mock_run: MagicMock) -> None:
         """Verify scan failures raise TrivyScanError."""
         mock_run.side_effect = Exception("Trivy command failed")
@@ -96,22 +112,18 @@ class TestTrivyScanning:
         with pytest.raises(TrivyScanError, match="Trivy scan failed"):
             run_trivy_scan("test-image:latest")
 
-    @patch("subprocess.run")
     def test_trivy_scan_timeout_handled(self, mock_run: MagicMock) -> None:
         """Verify timeout errors are handled."""
-        import subprocess
-
         mock_run.side_effect = subprocess.TimeoutExpired("trivy", 300)
 
-        with pytest.raises(TrivyScanError, match="timed out"):
+        with pytest.raises(TrivyScanError, match=_TIMED_OUT):
             run_trivy_scan("test-image:latest")
 
-    @patch("subprocess.run")
     def test_trivy_scan_invalid_json_raises_error(self, mock_run: MagicMock) -> None:
         """Verify invalid JSON output raises error."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="invalid json", stderr="")
+        mock_run.return_value = _INVALID_JSON
 
-        with pytest.raises(TrivyScanError, match="Failed to parse"):
+        with pytest.raises(TrivyScanError, match=_PARSE_FAILED):
             run_trivy_scan("test-image:latest", output_format="json")
 
 
@@ -204,6 +216,16 @@ class TestVulnerabilityFiltering:
         assert counts["MEDIUM"] == 1
         assert counts["LOW"] == 1
 
+    def test_count_vulnerabilities_ignores_unrecognized_severity(self) -> None:
+        """Verify severities outside the known levels are not counted."""
+        scan_results: dict[str, Any] = {
+            "Results": [{"Vulnerabilities": [{"Severity": "NEGLIGIBLE"}, {"Severity": "LOW"}]}]
+        }
+
+        counts = count_vulnerabilities_by_severity(scan_results)
+
+        assert counts == {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 1, "UNKNOWN": 0}
+
     def test_has_critical_vulnerabilities_true(self) -> None:
         """Verify detection of critical vulnerabilities."""
         scan_results = {
@@ -229,6 +251,15 @@ class TestVulnerabilityFiltering:
         assert has_critical_vulnerabilities(scan_results, "CRITICAL") is False
         assert has_critical_vulnerabilities(scan_results, "HIGH") is False
 
+    def test_has_critical_vulnerabilities_stops_at_first_match(self) -> None:
+        """Verify the check returns on the first qualifying vulnerability."""
+        # The second entry would raise if it were ever inspected
+        scan_results: dict[str, Any] = {
+            "Results": [{"Vulnerabilities": [{"Severity": "CRITICAL"}, None]}]
+        }
+
+        assert has_critical_vulnerabilities(scan_results, "HIGH") is True
+
     def test_has_critical_vulnerabilities_empty(self) -> None:
         """Verify handles empty scan results."""
         scan_results: dict[str, Any] = {"Results": []}
@@ -239,17 +270,14 @@ class TestVulnerabilityFiltering:
 class TestScanCaching:
     """Test scan result caching behavior."""
 
-    @patch("subprocess.run")
     def test_scan_results_cacheable(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Verify scan results can be cached to file."""
         cache_file = tmp_path / "trivy-cache.json"
-        scan_results = {"Results": [{"Vulnerabilities": [{"Severity": "HIGH"}]}]}
-
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(scan_results), stderr="")
+        mock_run.return_value = _SCAN_OUTPUT
 
         # Run scan with output file
         run_trivy_scan("test-image:latest", output_file=cache_file)
 
         # Verify file specified in command
-        args = mock_run.call_args[0][0]
+        args = mock_run.call_args.args[0]
         assert str(cache_file) in args
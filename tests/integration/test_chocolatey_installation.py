@@ -13,6 +13,12 @@ import pytest
 from kekkai_core.windows.chocolatey import generate_chocolatey_package_structure
 
 
+@pytest.fixture(scope="module")
+def default_structure() -> dict[str, str]:
+    """Generate the default 0.0.1 package once; tests only read it."""
+    return generate_chocolatey_package_structure(version="0.0.1", sha256="a" * 64)
+
+
 class TestChocolateyInstallation:
     """Test Chocolatey installation workflows."""
 
@@ -150,30 +156,25 @@ class TestChocolateyPackageValidation:
     """Test package structure validation without actual installation."""
 
     @pytest.mark.integration
-    def test_package_structure_completeness(self, tmp_path: Path) -> None:
+    def test_package_structure_completeness(self, default_structure: dict[str, str]) -> None:
         """Verify generated package structure is complete."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
         # Required files
-        assert "kekkai.nuspec" in structure
-        assert "tools/chocolateyinstall.ps1" in structure
-        assert "tools/chocolateyuninstall.ps1" in structure
+        assert "kekkai.nuspec" in default_structure
+        assert "tools/chocolateyinstall.ps1" in default_structure
+        assert "tools/chocolateyuninstall.ps1" in default_structure
 
         # Nuspec should be valid XML
-        nuspec_xml = structure["kekkai.nuspec"]
+        nuspec_xml = default_structure["kekkai.nuspec"]
         assert "<?xml version" in nuspec_xml
         assert "<package" in nuspec_xml
         assert "kekkai" in nuspec_xml
 
         # Scripts should be PowerShell
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
         assert "$ErrorActionPreference" in install_script
         assert "python -m pip install" in install_script
 
-        uninstall_script = structure["tools/chocolateyuninstall.ps1"]
+        uninstall_script = default_structure["tools/chocolateyuninstall.ps1"]
         assert "pip uninstall" in uninstall_script
 
     @pytest.mark.integration
@@ -211,14 +212,9 @@ class TestChocolateyEnterpriseScenarios:
     """Test enterprise deployment scenarios."""
 
     @pytest.mark.integration
-    def test_package_supports_silent_install(self, tmp_path: Path) -> None:
+    def test_package_supports_silent_install(self, default_structure: dict[str, str]) -> None:
         """Verify package structure supports silent installation."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
 
         # Silent install should not require user interaction
         # ErrorActionPreference = Stop will cause failures to abort
@@ -228,30 +224,21 @@ class TestChocolateyEnterpriseScenarios:
         assert "Read-Host" not in install_script
 
     @pytest.mark.integration
-    def test_package_handles_offline_scenarios(self, tmp_path: Path) -> None:
+    def test_package_handles_offline_scenarios(self, default_structure: dict[str, str]) -> None:
         """Verify package structure documents offline installation."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
         # Install script downloads from GitHub
         # For offline, wheel would need to be pre-downloaded
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
         assert "Invoke-WebRequest" in install_script
 
         # NOTE: Offline installation would require manual wheel download
         # and modification of install script to use local path
 
     @pytest.mark.integration
-    def test_package_error_messages_are_clear(self, tmp_path: Path) -> None:
+    def test_package_error_messages_are_clear(self, default_structure: dict[str, str]) -> None:
         """Verify package provides clear error messages."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
+        script_lower = install_script.lower()
 
         # Should have informative error messages
         assert "Python" in install_script
@@ -259,34 +246,24 @@ class TestChocolateyEnterpriseScenarios:
         assert "throw" in install_script or "Write-Error" in install_script
 
         # Errors should mention what failed
-        assert "checksum" in install_script.lower() or "failed" in install_script.lower()
+        assert "checksum" in script_lower or "failed" in script_lower
 
 
 class TestChocolateySecurityValidation:
     """Test security aspects of Chocolatey package."""
 
     @pytest.mark.integration
-    def test_package_uses_https_only(self, tmp_path: Path) -> None:
+    def test_package_uses_https_only(self, default_structure: dict[str, str]) -> None:
         """Verify all URLs use HTTPS."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
-        for file_content in structure.values():
+        for file_content in default_structure.values():
             # Check for any HTTP URLs (not HTTPS)
             if "http://" in file_content and "https://" not in file_content.replace("http://", ""):
                 pytest.fail(f"Found HTTP URL in: {file_content[:100]}")
 
     @pytest.mark.integration
-    def test_package_verifies_checksums(self, tmp_path: Path) -> None:
+    def test_package_verifies_checksums(self, default_structure: dict[str, str]) -> None:
         """Verify package validates file checksums."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
 
         # Should use Get-FileHash to verify checksum
         assert "Get-FileHash" in install_script
@@ -294,19 +271,15 @@ class TestChocolateySecurityValidation:
         assert "checksum" in install_script.lower()
 
     @pytest.mark.integration
-    def test_package_no_arbitrary_code_execution(self, tmp_path: Path) -> None:
+    def test_package_no_arbitrary_code_execution(self, default_structure: dict[str, str]) -> None:
         """Verify package doesn't execute arbitrary code."""
-        structure = generate_chocolatey_package_structure(
-            version="0.0.1",
-            sha256="a" * 64,
-        )
-
-        install_script = structure["tools/chocolateyinstall.ps1"]
+        install_script = default_structure["tools/chocolateyinstall.ps1"]
+        script_lower = install_script.lower()
 
         # Should not use Invoke-Expression
         assert "Invoke-Expression" not in install_script
-        assert " iex " not in install_script.lower()
+        assert " iex " not in script_lower
 
         # Should not pipe downloads to execution
         assert "| Invoke-Expression" not in install_script
-        assert "| iex" not in install_script.lower()
+        assert "| iex" not in script_lower
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from kekkai.triage.editor_support import (
+    EDITOR_REGISTRY,
     EditorConfig,
     build_editor_command,
     detect_editor_config,
@@ -77,6 +80,19 @@ class TestEditorDetection:
         config = detect_editor_config("VIM")
         assert config.syntax_type == "vim"
 
+    def test_detect_strips_extension_from_path(self) -> None:
+        """Test that directory and extension are stripped before lookup."""
+        config = detect_editor_config("/opt/editors/Code.cmd")
+        assert config.name == "code"
+
+        config = detect_editor_config("C:/Program Files/Notepad++/notepad++.exe")
+        assert config.syntax_type == "notepadpp"
+
+    def test_registry_is_read_only(self) -> None:
+        """Test that the shared editor registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            EDITOR_REGISTRY["evil"] = EditorConfig("evil", "vim")  # type: ignore[index]
+
 
 class TestEditorValidation:
     """Tests for editor name validation (ASVS V5.1.3)."""
@@ -115,6 +131,10 @@ class TestEditorValidation:
         """Test that empty editor name is rejected."""
         assert not validate_editor_name("")
 
+    def test_validate_reject_trailing_newline(self) -> None:
+        """Test that a trailing newline cannot slip past the anchor."""
+        assert not validate_editor_name("vim\n")
+
 
 class TestCommandBuilding:
     """Tests for editor command building."""
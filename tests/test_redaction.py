@@ -14,3 +14,27 @@ def test_redact_bearer() -> None:
     s = "Authorization: Bearer abc.def.ghi"
     out = redact(s)
     assert "abc.def.ghi" not in out
+
+
+def test_redact_bearer_with_embedded_key_value() -> None:
+    s = "Authorization: Bearer apikey=s3cr3tvalue"
+    out = redact(s)
+    assert "s3cr3tvalue" not in out
+    assert out.startswith("Authorization: Bearer [REDACTED]")
+
+
+def test_redact_preserves_key_names() -> None:
+    s = "token=abc, Bearer xyz; other=visible"
+    out = redact(s)
+    assert out == "token [REDACTED], Bearer [REDACTED]; other=visible"
+
+
+def test_redact_returns_clean_text_unchanged() -> None:
+    s = "submission failed: connection refused"
+    assert redact(s) is s
+
+
+def test_redact_matches_case_insensitive_lookalikes() -> None:
+    # U+017F (long s) matches "s" under re.IGNORECASE and must not skip the scan
+    s = "paſsword=hunter2"
+    assert "hunter2" not in redact(s)
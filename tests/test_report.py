@@ -257,6 +257,21 @@ class TestHTMLReportGenerator:
         assert "Reachability:" in html
         assert "likely_external" in html
 
+    def test_render_matches_written_report(
+        self, sample_findings: list[Finding], tmp_path: Path
+    ) -> None:
+        """Test render() returns the same HTML that generate() writes."""
+        from kekkai.compliance import map_findings_to_all_frameworks
+
+        gen = ReportGenerator(ReportConfig())
+        compliance = map_findings_to_all_frameworks(sample_findings)
+        report_data = gen._build_report_data(sample_findings, compliance)
+        html_gen = HTMLReportGenerator()
+
+        html_path = html_gen.generate(report_data, tmp_path)
+
+        assert html_path.read_text(encoding="utf-8") == html_gen.render(report_data)
+
     def test_severity_class_filter(self) -> None:
         """Test severity CSS class filter."""
         generator = HTMLReportGenerator()
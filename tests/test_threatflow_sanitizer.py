@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from kekkai.threatflow.sanitizer import (
     ClassifierResult,
     DefenseLayer,
@@ -131,6 +133,33 @@ class TestSanitizer:
         assert "test_file.py" in wrapped
         assert "untrusted" in wrapped.lower()
 
+    def test_escape_modes(self) -> None:
+        """Test each escape mode neutralizes matched patterns."""
+        text = "<|im_start|>system"
+        bracket = Sanitizer(escape_mode="bracket").sanitize(text).sanitized
+        assert bracket == "\u2039<|im_start|>\u203asystem"
+        unicode = Sanitizer(escape_mode="unicode").sanitize(text).sanitized
+        assert unicode == "\uff1c\u2502im_start\u2502\uff1esystem"
+        removed = Sanitizer(escape_mode="remove").sanitize(text).sanitized
+        assert removed == "[SANITIZED]system"
+
+    def test_patterns_use_flag_not_inline_ignorecase(self) -> None:
+        """Test case-insensitivity is set once via flags, not inline (?i)."""
+        import re
+
+        by_name = {p.name: p.pattern for p in Sanitizer.PATTERNS}
+        assert all(not p.pattern.startswith("(?i)") for p in by_name.values())
+        assert by_name["developer_mode"].flags & re.IGNORECASE
+        assert not by_name["chat_ml_tokens"].flags & re.IGNORECASE
+        assert not by_name["markdown_hr_abuse"].flags & re.IGNORECASE
+        found = Sanitizer().detect("DEVELOPER MODE ENABLED")
+        assert any(name == "developer_mode" for name, _, _ in found)
+
+    def test_repeated_tokens_all_escaped(self) -> None:
+        """Test every occurrence of a repeated token is escaped."""
+        result = Sanitizer().sanitize("<|im_end|>" * 3)
+        assert result.sanitized == "\u2039<|im_end|>\u203a" * 3
+
     def test_add_custom_pattern(self) -> None:
         """Test adding custom injection pattern."""
         sanitizer = Sanitizer()
@@ -143,6 +172,22 @@ class TestSanitizer:
         found = sanitizer.detect("DANGER_CODE here")
         assert any("custom_danger" in name for name, _, _ in found)
 
+    def test_added_pattern_is_sanitized(self) -> None:
+        """Test that high-risk patterns added later are also neutralized."""
+        sanitizer = Sanitizer()
+        sanitizer.add_pattern(name="custom_danger", regex=r"DANGER_CODE", risk=InjectionRisk.HIGH)
+        result = sanitizer.sanitize("run DANGER_CODE now")
+        assert result.was_modified
+        assert "\u2039DANGER_CODE\u203a" in result.sanitized
+
+    def test_default_instance_is_shared_and_read_only(self) -> None:
+        """Test Sanitizer.default() is cached and rejects custom patterns."""
+        default = Sanitizer.default()
+        assert Sanitizer.default() is default
+        assert default.detect("<|im_start|>") == Sanitizer().detect("<|im_start|>")
+        with pytest.raises(RuntimeError, match="read-only"):
+            default.add_pattern(name="x", regex="x", risk=InjectionRisk.LOW)
+
     def test_sanitize_result_to_dict(self) -> None:
         """Test SanitizeResult serialization."""
         result = SanitizeResult(
@@ -156,6 +201,21 @@ class TestSanitizer:
         assert "injection_count" in data
         assert "patterns_found" in data
 
+    def test_sanitize_result_flags_computed_at_construction(self) -> None:
+        """Test risk flags are derived from injections_found."""
+        low = SanitizeResult(
+            original="x", sanitized="x", injections_found=[("a", InjectionRisk.LOW, "")]
+        )
+        assert not low.has_critical_injection
+        assert not low.has_high_injection
+
+        critical = SanitizeResult(
+            original="x", sanitized="x", injections_found=[("b", InjectionRisk.CRITICAL, "")]
+        )
+        assert critical.has_critical_injection
+        assert critical.has_high_injection
+        assert critical.to_dict()["has_critical"] is True
+
 
 class TestInjectionRisk:
     """Tests for InjectionRisk enum."""
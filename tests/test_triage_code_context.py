@@ -256,7 +256,9 @@ class TestCodeContextExtractor:
 
         assert extractor.repo_path == temp_repo.resolve()
         assert extractor.max_file_size_mb == 5
+        assert extractor._prompt_builder_instance is None
         assert extractor._prompt_builder is not None
+        assert extractor._prompt_builder is extractor._prompt_builder_instance
 
     def test_validate_path_within_repo(
         self, temp_repo: Path, extractor: CodeContextExtractor
@@ -272,6 +274,14 @@ class TestCodeContextExtractor:
         outside_path = (tmp_path / "outside.py").resolve()
         assert extractor._validate_path(outside_path) is False
 
+    def test_validate_path_rejects_sibling_with_shared_prefix(
+        self, temp_repo: Path, extractor: CodeContextExtractor
+    ) -> None:
+        """Test _validate_path rejects a sibling dir whose name extends the repo name."""
+        sibling = temp_repo.resolve().parent / (temp_repo.name + "-evil") / "file.py"
+        assert extractor._validate_path(sibling) is False
+        assert extractor._validate_path(temp_repo.resolve()) is True
+
     def test_extract_windows1252_file(
         self, temp_repo: Path, extractor: CodeContextExtractor
     ) -> None:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -282,6 +284,129 @@ class TestContextExpansion:
             # Should stay at 100 (maximum)
             assert screen.context_lines == 100
 
+    def test_expand_then_shrink_reuses_highlighted_code(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test E then S reuses the first Syntax and updates the widget in place."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "web.py").write_text("\n".join(f"x{i} = {i}" for i in range(60)))
+        screen = FindingDetailScreen(
+            finding=sample_finding,
+            repo_path=tmp_path,
+            context_lines=10,
+        )
+        assert screen._render_code_context() is not None
+        first = screen._shown_code
+
+        with (
+            patch.object(screen, "notify"),
+            patch.object(screen, "_code_widget") as mock_widget,
+        ):
+            screen.action_expand_context()
+            screen._apply_code_context()
+            assert screen._shown_code is not first
+            screen.action_shrink_context()
+            screen._apply_code_context()
+
+        assert screen._shown_code is first
+        assert mock_widget.update.call_count == 2
+
+    def test_rapid_expand_presses_extract_once(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test held E presses coalesce into a single re-extraction."""
+        import asyncio
+
+        from textual.app import App
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "web.py").write_text("\n".join(f"x{i} = {i}" for i in range(200)))
+        screen = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+
+        class _DetailApp(App[None]):
+            def on_mount(self) -> None:
+                self.push_screen(screen)
+
+        async def run() -> None:
+            async with _DetailApp().run_test() as pilot:
+                await pilot.pause()
+                initial_code = screen._shown_code
+                with patch.object(
+                    screen._code_extractor, "extract", wraps=screen._code_extractor.extract
+                ) as mock_extract:
+                    for _ in range(3):
+                        screen.action_expand_context()
+                    await pilot.pause(0.2)
+                    assert mock_extract.call_count == 1
+                assert screen.context_lines == 40
+                assert not screen._context_dirty
+                assert screen._shown_code is not initial_code
+
+        asyncio.run(run())
+
+    def test_refresh_deferred_when_not_shown(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test expand on an unmounted screen only marks the pane dirty."""
+        screen = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+
+        with patch.object(screen, "notify"), patch.object(screen, "_apply_code_context") as apply:
+            screen.action_expand_context()
+
+        apply.assert_not_called()
+        assert screen._context_dirty
+
+    def test_context_extraction_memoized_until_file_changes(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test E then S reuses the extracted window until the file's mtime changes."""
+        source = tmp_path / "src" / "web.py"
+        source.parent.mkdir()
+        source.write_text("\n".join(f"x{i} = {i}" for i in range(60)))
+        screen = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+        extractor = screen._code_extractor
+
+        with patch.object(extractor, "extract", wraps=extractor.extract) as mock_extract:
+            first = screen._extract_context("src/web.py", 10)
+            screen.context_lines = 20
+            screen._extract_context("src/web.py", 10)
+            screen.context_lines = 10
+            assert screen._extract_context("src/web.py", 10) is first
+            assert mock_extract.call_count == 2
+
+            os.utime(source, (1, 1))
+            assert screen._extract_context("src/web.py", 10) is not first
+            assert mock_extract.call_count == 3
+
+    def test_initial_render_uses_configured_context_lines(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test the first code render honours context_lines from the CLI."""
+        source = tmp_path / "src" / "web.py"
+        source.parent.mkdir()
+        source.write_text("\n".join(f"x{i} = {i}" for i in range(100)))
+        screen = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path, context_lines=30)
+
+        context = screen._extract_context("src/web.py", 50)
+
+        assert context is not None
+        assert "x25 = 25" in context.code
+
+    def test_code_extractor_built_on_demand(self, tmp_path: Path) -> None:
+        """Test findings without a file location never build an extractor."""
+        finding = FindingEntry(
+            id="CVE-2024-0001",
+            title="Dependency vulnerability",
+            severity=Severity.HIGH,
+            scanner="trivy",
+        )
+        screen = FindingDetailScreen(finding=finding, repo_path=tmp_path)
+
+        assert screen._render_code_context() is None
+        with patch.object(screen, "notify"):
+            screen.action_expand_context()
+        assert "_code_extractor" not in vars(screen)
+
     def test_context_lines_passed_from_cli(
         self, sample_finding: FindingEntry, tmp_path: Path
     ) -> None:
@@ -325,6 +450,23 @@ class TestAIFixWorkflow:
         assert "Ctrl+O" in hints_text or "ctrl+o" in hints_text.lower()
         assert "EDITOR" in hints_text or "editor" in hints_text.lower()
 
+    def test_action_hints_built_once(self, sample_finding: FindingEntry, tmp_path: Path) -> None:
+        """Test detail screens share one prebuilt hints renderable."""
+        first = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+        second = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+
+        assert first._action_hints() is second._action_hints()
+
+    def test_notes_read_from_composed_text_area(
+        self, sample_finding: FindingEntry, tmp_path: Path
+    ) -> None:
+        """Test notes come from the composed TextArea, or are empty before compose."""
+        screen = FindingDetailScreen(finding=sample_finding, repo_path=tmp_path)
+        assert screen._get_notes() == ""
+
+        screen._notes_area = MagicMock(text="reviewed with team")
+        assert screen._get_notes() == "reviewed with team"
+
     def test_fix_with_ai_requires_file_and_line(self, tmp_path: Path) -> None:
         """Test AI fix requires file path and line."""
         finding_no_file = FindingEntry(
@@ -406,3 +548,57 @@ class TestVerificationHints:
         hints = screen._get_verification_hints()
 
         assert "helpers.py" in hints
+
+
+class TestOllamaDetection:
+    """Tests for cached Ollama availability check."""
+
+    def test_path_scanned_once(self) -> None:
+        """Test repeated checks reuse the first shutil.which result."""
+        from kekkai.triage import fix_screen
+
+        fix_screen._ollama_available.cache_clear()
+        try:
+            with patch("kekkai.triage.fix_screen.shutil.which", return_value=None) as mock_which:
+                assert fix_screen._ollama_available() is False
+                assert fix_screen._ollama_available() is False
+                mock_which.assert_called_once_with("ollama")
+        finally:
+            fix_screen._ollama_available.cache_clear()
+
+
+class TestFixScreenConfig:
+    """Tests for the fix modal's backend config snapshot."""
+
+    def test_backend_config_snapshot_at_init(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test env and Ollama state are captured when the modal is built."""
+        from kekkai.triage import fix_screen
+
+        monkeypatch.setattr(fix_screen, "_ollama_available", lambda: False)
+        monkeypatch.delenv("KEKKAI_FIX_API_KEY", raising=False)
+        finding = FindingEntry(
+            id="TEST-007", title="Issue", severity=Severity.LOW, scanner="semgrep"
+        )
+        screen = fix_screen.FixGenerationScreen(finding=finding)
+
+        monkeypatch.setenv("KEKKAI_FIX_API_KEY", "set-after-init")
+        assert screen._api_key is None
+        assert "no ai backend" in str(screen._initial_status).lower()
+        assert screen._initial_status is screen._initial_status
+
+
+class TestLazyImports:
+    """Tests that the fix modal and fix engine stay off the TUI startup path."""
+
+    def test_triage_app_import_defers_fix_modules(self) -> None:
+        """Test importing the triage app loads neither fix_screen nor kekkai.fix."""
+        code = (
+            "import sys, kekkai.triage.app; "
+            "print(sorted(m for m in ('kekkai.fix', 'kekkai.triage.fix_screen') "
+            "if m in sys.modules))"
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert result.stdout.strip() == "[]"
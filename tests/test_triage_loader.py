@@ -86,6 +86,42 @@ class TestLoadFindingsFromPath:
         assert findings[0].line == 42
         assert not errors
 
+    def test_load_scanner_raw_with_utf8_bom(self, tmp_path: Path) -> None:
+        """Test raw scanner output with a UTF-8 BOM reaches the scanner parser intact."""
+        data = {"results": [{"check_id": "rule", "path": "a.py", "start": {"line": 1}}]}
+        file_path = tmp_path / "semgrep-results.json"
+        file_path.write_bytes(b"\xef\xbb\xbf" + json.dumps(data).encode())
+
+        findings, errors = load_findings_from_path(file_path)
+
+        assert not errors
+        assert len(findings) == 1
+        assert findings[0].file_path == "a.py"
+
+    def test_scanner_instance_reused_across_files(self, tmp_path: Path) -> None:
+        """Test one scanner instance is created per scanner type, not per file."""
+        from unittest.mock import patch
+
+        from kekkai import cli
+        from kekkai.triage import loader
+
+        data = {"results": [{"check_id": "rule", "path": "a.py", "start": {"line": 1}}]}
+        for i in range(3):
+            run_dir = tmp_path / f"run{i}"
+            run_dir.mkdir()
+            (run_dir / "semgrep-results.json").write_text(json.dumps(data))
+
+        loader._scanner_for.cache_clear()
+        try:
+            with patch("kekkai.cli._create_scanner", wraps=cli._create_scanner) as m:
+                for i in range(3):
+                    findings, errors = load_findings_from_path(tmp_path / f"run{i}")
+                    assert len(findings) == 1
+                    assert not errors
+            assert m.call_count == 1
+        finally:
+            loader._scanner_for.cache_clear()
+
     def test_load_trivy_raw(self, tmp_path: Path) -> None:
         """Test loading raw Trivy JSON output."""
         data = {
@@ -170,6 +206,17 @@ class TestLoadFindingsFromPath:
         assert len(findings) == 1
         assert findings[0].scanner == "semgrep"
 
+    def test_load_directory_skips_json_named_subdirs(self, tmp_path: Path) -> None:
+        """Test that directories matching *-results.json are not treated as files."""
+        (tmp_path / "nested-results.json").mkdir()
+        data = {"results": [{"check_id": "r", "path": "a.py", "start": {"line": 3}}]}
+        (tmp_path / "semgrep-results.json").write_text(json.dumps(data))
+
+        findings, errors = load_findings_from_path(tmp_path)
+
+        assert len(findings) == 1
+        assert not errors
+
     def test_deduplication(self, tmp_path: Path) -> None:
         """Test that duplicate findings are removed."""
         data = {
@@ -201,6 +248,7 @@ class TestLoadFindingsFromPath:
 
         # Should deduplicate based on scanner:rule_id:file_path:line
         assert len(findings) == 1
+        assert findings[0].id == "dup"  # First occurrence wins
 
     def test_empty_file_skipped(self, tmp_path: Path) -> None:
         """Test that empty files are skipped without error."""
@@ -212,6 +260,26 @@ class TestLoadFindingsFromPath:
         assert len(findings) == 0
         assert not errors
 
+    def test_whitespace_only_file_skipped(self, tmp_path: Path) -> None:
+        """Test that whitespace-only files are skipped like empty ones."""
+        file_path = tmp_path / "blank.json"
+        file_path.write_text("  \n\t\n")
+
+        findings, errors = load_findings_from_path(file_path)
+
+        assert len(findings) == 0
+        assert not errors
+
+    def test_non_utf8_file_error(self, tmp_path: Path) -> None:
+        """Test that undecodable bytes produce an error instead of raising."""
+        file_path = tmp_path / "latin1.json"
+        file_path.write_bytes(b'{"title": "caf\xe9"}')
+
+        findings, errors = load_findings_from_path(file_path)
+
+        assert len(findings) == 0
+        assert errors == ["latin1.json: UnicodeDecodeError"]
+
     def test_invalid_json_error(self, tmp_path: Path) -> None:
         """Test that invalid JSON produces error message."""
         file_path = tmp_path / "invalid.json"
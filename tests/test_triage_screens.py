@@ -0,0 +1,280 @@
+"""Unit tests for the triage finding list screen."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from textual.app import App
+from textual.geometry import Region
+
+from kekkai.triage.models import FindingEntry, Severity, TriageState
+from kekkai.triage.screens import CARD_CACHE_SIZE, STATUS_CACHE_SIZE, FindingListScreen
+from kekkai.triage.widgets import FindingCard
+
+
+def _findings(count: int) -> list[FindingEntry]:
+    return [
+        FindingEntry(
+            id=f"F-{i}",
+            title=f"Finding {i}",
+            severity=Severity.HIGH,
+            scanner="semgrep",
+            file_path="src/app.py",
+            line=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+class _ListApp(App[None]):
+    def __init__(self, findings: list[FindingEntry]) -> None:
+        super().__init__()
+        self.list_screen = FindingListScreen(findings)
+
+    def on_mount(self) -> None:
+        self.push_screen(self.list_screen)
+
+
+class TestVirtualizedList:
+    """Tests for windowed card mounting in FindingListScreen."""
+
+    def test_mounts_only_visible_cards(self) -> None:
+        """Test a large finding set mounts a viewport-sized window of cards."""
+
+        async def run() -> None:
+            app = _ListApp(_findings(1000))
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                assert 0 < len(screen._cards) < 20
+                assert 0 in screen._cards
+                assert screen._cards[0].selected
+
+        asyncio.run(run())
+
+    def test_selection_scrolls_card_into_view(self) -> None:
+        """Test jumping far down mounts the selected card and drops the old ones."""
+
+        async def run() -> None:
+            app = _ListApp(_findings(1000))
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                screen._update_selection(500)
+                await pilot.pause()
+                await pilot.pause()
+
+                assert 500 in screen._cards
+                assert screen._cards[500].selected
+                assert 0 not in screen._cards
+                assert len(screen._cards) < 20
+
+        asyncio.run(run())
+
+    def test_scrolling_back_reuses_cached_card(self) -> None:
+        """Test a card hidden by scrolling is shown again instead of rebuilt."""
+
+        async def run() -> None:
+            findings = _findings(1000)
+            app = _ListApp(findings)
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                first_card = screen._cards[0]
+                screen._update_selection(500)
+                await pilot.pause()
+                await pilot.pause()
+                assert first_card in screen._card_cache.values()
+                assert not first_card.display
+
+                screen._update_selection(0)
+                await pilot.pause()
+                await pilot.pause()
+                assert screen._cards[0] is first_card
+                assert first_card.display
+                assert first_card.selected
+
+                cards = [c for c in screen._list.children if isinstance(c, FindingCard)]
+                order = [findings.index(c.finding) for c in cards]
+                assert order == sorted(order)
+
+        asyncio.run(run())
+
+    def test_card_cache_is_bounded(self) -> None:
+        """Test hidden cards beyond the cache size are removed."""
+
+        async def run() -> None:
+            app = _ListApp(_findings(1000))
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                for target in range(0, 1000, 50):
+                    screen._update_selection(target)
+                    await pilot.pause()
+                assert len(screen._card_cache) <= CARD_CACHE_SIZE
+
+        asyncio.run(run())
+
+    def test_cards_are_recycled_once_cache_is_full(self) -> None:
+        """Test a long sweep rebinds pooled cards instead of building new ones."""
+
+        async def run() -> None:
+            findings = _findings(2000)
+            position = {id(f): i for i, f in enumerate(findings)}
+            app = _ListApp(findings)
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                seen: set[int] = set()
+                for target in range(0, 2000, 100):
+                    screen._update_selection(target)
+                    await pilot.pause()
+                    cards = [c for c in screen._list.children if isinstance(c, FindingCard)]
+                    seen.update(id(c) for c in cards)
+                    order = [position[id(c.finding)] for c in cards]
+                    assert order == sorted(order)
+                    assert screen._cards[target].finding is findings[target]
+
+                assert len(seen) <= CARD_CACHE_SIZE + 20
+
+        asyncio.run(run())
+
+    def test_mark_state_on_mounted_card(self) -> None:
+        """Test marking the selected finding updates data and status bar."""
+
+        async def run() -> None:
+            findings = _findings(50)
+            app = _ListApp(findings)
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                await pilot.press("j", "c")
+                assert findings[1].state == TriageState.CONFIRMED
+                assert "Confirmed: 1" in str(app.list_screen._status_text())
+
+        asyncio.run(run())
+
+    def test_rapid_marks_coalesce_status_updates(self) -> None:
+        """Test a burst of marks redraws the status bar once with the final totals."""
+
+        async def run() -> None:
+            findings = _findings(50)
+            app = _ListApp(findings)
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.pause()
+                screen = app.list_screen
+                with patch.object(
+                    screen, "_update_status_now", wraps=screen._update_status_now
+                ) as update_now:
+                    screen.action_mark_false_positive()
+                    screen.action_mark_confirmed()
+                    screen.action_mark_deferred()
+                    await pilot.pause(0.1)
+                    assert update_now.call_count == 1
+                assert screen._counts[TriageState.DEFERRED] == 1
+                assert screen._counts[TriageState.CONFIRMED] == 0
+
+        asyncio.run(run())
+
+    def test_long_rule_id_keeps_file_row_visible(self) -> None:
+        """Test long card rows are cut to one line so the file row still fits."""
+
+        async def run() -> None:
+            finding = FindingEntry(
+                id="F-0",
+                title="T" * 90,
+                severity=Severity.HIGH,
+                scanner="semgrep",
+                rule_id="python.lang.security.audit." + "long-rule-segment." * 8 + "end",
+                file_path="src/app.py",
+                line=42,
+            )
+            app = _ListApp([finding])
+            async with app.run_test(size=(80, 24)) as pilot:
+                await pilot.pause()
+                card = app.list_screen._cards[0]
+                strips = card.render_lines(Region(0, 0, *card.outer_size))
+                rows = [strip.text for strip in strips]
+                assert any("File: src/app.py:42" in row for row in rows)
+                assert any("Rule: python.lang.security" in row for row in rows)
+
+        asyncio.run(run())
+
+    def test_empty_findings(self) -> None:
+        """Test the list screen handles an empty finding set."""
+
+        async def run() -> None:
+            app = _ListApp([])
+            async with app.run_test(size=(80, 40)) as pilot:
+                await pilot.press("j", "f")
+                assert app.list_screen._cards == {}
+
+        asyncio.run(run())
+
+
+class TestStatusCounts:
+    """Tests for the incrementally maintained status bar totals."""
+
+    def test_counts_seeded_from_findings(self) -> None:
+        """Test initial totals reflect the states findings were loaded with."""
+        findings = _findings(5)
+        findings[0].state = TriageState.CONFIRMED
+        screen = FindingListScreen(findings)
+
+        text = str(screen._status_text())
+        assert "Pending: 4" in text
+        assert "Confirmed: 1" in text
+
+    def test_mark_state_moves_count(self) -> None:
+        """Test re-marking a finding moves it between totals."""
+        findings = _findings(3)
+        screen = FindingListScreen(findings)
+        with patch.object(FindingListScreen, "app"), patch.object(screen, "_update_status"):
+            screen._mark_state(TriageState.FALSE_POSITIVE)
+            screen._mark_state(TriageState.DEFERRED)
+
+        assert screen._counts[TriageState.PENDING] == 2
+        assert screen._counts[TriageState.FALSE_POSITIVE] == 0
+        assert screen._counts[TriageState.DEFERRED] == 1
+
+    def test_detail_state_change_uses_state_before_detail(self) -> None:
+        """Test the detail screen callback counts from the pre-detail state."""
+        findings = _findings(3)
+        screen = FindingListScreen(findings)
+        screen._detail_previous_state = findings[0].state
+
+        # FindingDetailScreen writes the state before invoking the callback
+        findings[0].state = TriageState.CONFIRMED
+        with patch.object(FindingListScreen, "app"), patch.object(screen, "_update_status"):
+            screen._handle_detail_state_change(TriageState.CONFIRMED, "checked")
+
+        assert screen._counts[TriageState.PENDING] == 2
+        assert screen._counts[TriageState.CONFIRMED] == 1
+        assert findings[0].notes == "checked"
+
+    def test_status_text_reused_for_same_counts(self) -> None:
+        """Test toggling back to earlier totals returns the cached status text."""
+        findings = _findings(3)
+        screen = FindingListScreen(findings)
+        pending_text = screen._status_text()
+
+        with patch.object(FindingListScreen, "app"), patch.object(screen, "_update_status"):
+            screen._mark_state(TriageState.CONFIRMED)
+            confirmed_text = screen._status_text()
+            screen._mark_state(TriageState.PENDING)
+
+        assert confirmed_text is not pending_text
+        assert screen._status_text() is pending_text
+
+    def test_status_cache_is_bounded(self) -> None:
+        """Test the status text cache evicts the least recently used totals."""
+        findings = _findings(STATUS_CACHE_SIZE + 5)
+        screen = FindingListScreen(findings)
+
+        with patch.object(FindingListScreen, "app"), patch.object(screen, "_update_status"):
+            for i in range(len(findings)):
+                screen.selected_index = i
+                screen._mark_state(TriageState.DEFERRED)
+                screen._status_text()
+
+        assert len(screen._status_cache) == STATUS_CACHE_SIZE
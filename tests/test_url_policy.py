@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import ipaddress
+import random
+import socket
+import time
+from collections.abc import Iterator
 from unittest import mock
 
 import pytest
 
 from kekkai.scanners.url_policy import (
+    _BLOCKED_V4_CIDRS,
+    _BLOCKED_V6_CIDRS,
+    RESOLVE_CACHE_SIZE,
+    RESOLVE_CACHE_TTL,
     UrlPolicy,
     UrlPolicyError,
     _is_blocked_ip,
+    _resolve_cache,
+    _resolve_host,
     is_private_ip_range,
     validate_target_url,
 )
@@ -147,6 +157,87 @@ class TestIsBlockedIp:
     def test_ipv6_loopback_blocked(self) -> None:
         assert _is_blocked_ip(ipaddress.ip_address("::1"))
 
+    def test_shared_address_space_blocked(self) -> None:
+        assert _is_blocked_ip(ipaddress.ip_address("100.64.0.1"))
+        assert not _is_blocked_ip(ipaddress.ip_address("100.128.0.0"))
+
+    def test_ipv4_mapped_ipv6_uses_ipv4_ranges(self) -> None:
+        assert _is_blocked_ip(ipaddress.ip_address("::ffff:127.0.0.1"))
+        assert _is_blocked_ip(ipaddress.ip_address("::ffff:10.0.0.1"))
+        assert not _is_blocked_ip(ipaddress.ip_address("::ffff:8.8.8.8"))
+
+    def test_stricter_than_stdlib_in_special_purpose_ranges(self) -> None:
+        assert _is_blocked_ip(ipaddress.ip_address("192.0.0.9"))
+        assert _is_blocked_ip(ipaddress.ip_address("192.0.0.10"))
+        assert _is_blocked_ip(ipaddress.ip_address("2001:1::1"))
+        assert _is_blocked_ip(ipaddress.ip_address("2001:20::1"))
+
+    def test_public_ipv6_not_blocked(self) -> None:
+        assert not _is_blocked_ip(ipaddress.ip_address("2606:4700::1"))
+
+    def test_blocks_everything_stdlib_treats_as_non_global(self) -> None:
+        rng = random.Random(0)
+        samples = [ipaddress.IPv4Address(rng.getrandbits(32)) for _ in range(20000)]
+        for cidr in _BLOCKED_V4_CIDRS + _BLOCKED_V6_CIDRS:
+            network = ipaddress.ip_network(cidr)
+            samples += [network.network_address, network.broadcast_address]
+        for ip in samples:
+            if not ip.is_global:
+                assert _is_blocked_ip(ip), ip
+
+
+class TestResolveHostCache:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        _resolve_cache.clear()
+        yield
+        _resolve_cache.clear()
+
+    @staticmethod
+    def _infos(address: str) -> list[tuple[object, ...]]:
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0))]
+
+    def test_repeated_lookup_is_cached(self) -> None:
+        with mock.patch("socket.getaddrinfo", return_value=self._infos("93.184.216.34")) as gai:
+            first = _resolve_host("example.com")
+            second = _resolve_host("example.com")
+        assert first == second == [ipaddress.IPv4Address("93.184.216.34")]
+        assert gai.call_count == 1
+
+    def test_expired_entry_is_refreshed(self) -> None:
+        with mock.patch("socket.getaddrinfo", return_value=self._infos("93.184.216.34")) as gai:
+            _resolve_host("example.com")
+            with mock.patch(
+                "kekkai.scanners.url_policy.time.monotonic",
+                return_value=time.monotonic() + RESOLVE_CACHE_TTL + 1,
+            ):
+                _resolve_host("example.com")
+        assert gai.call_count == 2
+
+    def test_failures_are_not_cached(self) -> None:
+        with mock.patch("socket.getaddrinfo", side_effect=socket.gaierror) as gai:
+            assert _resolve_host("missing.invalid") == []
+            assert _resolve_host("missing.invalid") == []
+        assert gai.call_count == 2
+        assert "missing.invalid" not in _resolve_cache
+
+    def test_blocklist_applies_to_cached_addresses(self) -> None:
+        with mock.patch("socket.getaddrinfo", return_value=self._infos("10.0.0.5")):
+            _resolve_host("internal.example.com")
+            with pytest.raises(UrlPolicyError, match="blocked IP"):
+                validate_target_url("https://internal.example.com/")
+        allowed = validate_target_url(
+            "https://internal.example.com/", UrlPolicy(allow_private_ips=True)
+        )
+        assert allowed == "https://internal.example.com/"
+
+    def test_cache_is_bounded(self) -> None:
+        with mock.patch("socket.getaddrinfo", return_value=self._infos("93.184.216.34")):
+            for i in range(RESOLVE_CACHE_SIZE + 5):
+                _resolve_host(f"host{i}.example.com")
+        assert len(_resolve_cache) == RESOLVE_CACHE_SIZE
+        assert "host0.example.com" not in _resolve_cache
+
 
 class TestIsPrivateIpRange:
     def test_private_cidr_is_private(self) -> None: